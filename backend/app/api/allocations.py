@@ -1,23 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.database import get_db
-from app.schemas.allocation import Allocation, AllocationCreate, AllocationUpdate, AllocationWithAsset
+from app.cache import conditional_response
+from app.schemas.allocation import Allocation, AllocationCreate, AllocationImport, AllocationUpdate, AllocationWithAsset
 from app.services.allocation import (
     get_allocations, get_allocation, create_allocation, update_allocation,
-    delete_allocation, get_client_allocations
+    delete_allocation, get_client_allocations, create_allocations_bulk
 )
-from app.auth.dependencies import get_current_active_user
+from app.auth.dependencies import get_current_user
 from app.models.user import User as UserModel
+import orjson
 
 router = APIRouter()
 
+ALLOCATION_DELETED_BODY = orjson.dumps({"message": "Allocation deleted successfully"})
+
 @router.get("/", response_model=list[Allocation])
 async def read_allocations(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Get all allocations with pagination"""
     allocations = await get_allocations(db, skip=skip, limit=limit)
@@ -27,7 +31,7 @@ async def read_allocations(
 async def create_new_allocation(
     allocation: AllocationCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Create a new allocation"""
     db_allocation = await create_allocation(db, allocation)
@@ -36,25 +40,41 @@ async def create_new_allocation(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Could not create allocation. Check if asset exists."
         )
+    await db.commit()
     return db_allocation
 
+@router.post("/bulk", response_model=list[Allocation])
+async def create_allocations_bulk_endpoint(
+    allocations: list[AllocationImport],
+    db: AsyncSession = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user)
+):
+    """Create several allocations at once, creating missing assets from their tickers"""
+    try:
+        db_allocations = await create_allocations_bulk(db, allocations)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    await db.commit()
+    return db_allocations
+
 @router.get("/{allocation_id}", response_model=Allocation)
 async def read_allocation(
+    request: Request,
     allocation_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Get a specific allocation by ID"""
     db_allocation = await get_allocation(db, allocation_id)
     if db_allocation is None:
         raise HTTPException(status_code=404, detail="Allocation not found")
-    return db_allocation
+    return conditional_response(request, Allocation, db_allocation)
 
 @router.get("/client/{client_id}", response_model=list[AllocationWithAsset])
 async def read_client_allocations(
     client_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Get all allocations for a specific client"""
     allocations = await get_client_allocations(db, client_id)
@@ -65,22 +85,24 @@ async def update_existing_allocation(
     allocation_id: int,
     allocation: AllocationUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Update an allocation"""
     db_allocation = await update_allocation(db, allocation_id, allocation)
     if db_allocation is None:
         raise HTTPException(status_code=404, detail="Allocation not found")
+    await db.commit()
     return db_allocation
 
 @router.delete("/{allocation_id}")
 async def delete_existing_allocation(
     allocation_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Delete an allocation"""
     db_allocation = await delete_allocation(db, allocation_id)
     if db_allocation is None:
         raise HTTPException(status_code=404, detail="Allocation not found")
-    return {"message": "Allocation deleted successfully"}
\ No newline at end of file
+    await db.commit()
+    return Response(ALLOCATION_DELETED_BODY, media_type="application/json")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from app.database import get_db
@@ -8,36 +8,47 @@ from app.services.asset import (
     search_assets_by_ticker, create_asset_from_ticker
 )
 from app.services.yahoo_finance import fetch_asset_data
-from app.auth.dependencies import get_current_active_user
+from app.auth.dependencies import get_current_user
 from app.models.user import User as UserModel
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
+import orjson
+
+ASSETS_CACHE_NAMESPACE = "assets"
 
 router = APIRouter()
 
+ASSET_DELETED_BODY = orjson.dumps({"message": "Asset deleted successfully"})
+
 @router.get("/", response_model=list[Asset])
+@cache(expire=300, namespace=ASSETS_CACHE_NAMESPACE)
 async def read_assets(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Get all assets with pagination"""
     assets = await get_assets(db, skip=skip, limit=limit)
-    return assets
+    return [Asset.model_validate(asset) for asset in assets]
 
 @router.post("/", response_model=Asset)
 async def create_new_asset(
     asset: AssetCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Create a new asset"""
-    return await create_asset(db, asset)
+    db_asset = await create_asset(db, asset)
+    await db.commit()
+    await FastAPICache.clear(namespace=ASSETS_CACHE_NAMESPACE)
+    return db_asset
 
 @router.post("/from-ticker/{ticker}", response_model=Asset)
 async def create_asset_from_ticker_endpoint(
     ticker: str,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Create asset from Yahoo Finance ticker"""
     asset = await create_asset_from_ticker(db, ticker)
@@ -46,60 +57,68 @@ async def create_asset_from_ticker_endpoint(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Could not fetch data for ticker {ticker}"
         )
+    await db.commit()
+    await FastAPICache.clear(namespace=ASSETS_CACHE_NAMESPACE)
     return asset
 
 @router.get("/{asset_id}", response_model=Asset)
+@cache(expire=300, namespace=ASSETS_CACHE_NAMESPACE)
 async def read_asset(
     asset_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Get a specific asset by ID"""
     db_asset = await get_asset(db, asset_id)
     if db_asset is None:
         raise HTTPException(status_code=404, detail="Asset not found")
-    return db_asset
+    return Asset.model_validate(db_asset)
 
 @router.put("/{asset_id}", response_model=Asset)
 async def update_existing_asset(
     asset_id: int,
     asset: AssetUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Update an asset"""
     db_asset = await update_asset(db, asset_id, asset)
     if db_asset is None:
         raise HTTPException(status_code=404, detail="Asset not found")
+    await db.commit()
+    await FastAPICache.clear(namespace=ASSETS_CACHE_NAMESPACE)
     return db_asset
 
 @router.delete("/{asset_id}")
 async def delete_existing_asset(
     asset_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Delete an asset"""
     db_asset = await delete_asset(db, asset_id)
     if db_asset is None:
         raise HTTPException(status_code=404, detail="Asset not found")
-    return {"message": "Asset deleted successfully"}
+    await db.commit()
+    await FastAPICache.clear(namespace=ASSETS_CACHE_NAMESPACE)
+    return Response(ASSET_DELETED_BODY, media_type="application/json")
 
 @router.get("/search/{ticker}", response_model=list[Asset])
+@cache(expire=300, namespace=ASSETS_CACHE_NAMESPACE)
 async def search_assets(
     ticker: str,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Search assets by ticker"""
     assets = await search_assets_by_ticker(db, ticker)
-    return assets
+    return [Asset.model_validate(asset) for asset in assets]
 
 @router.get("/fetch-yahoo/{ticker}")
 async def fetch_yahoo_data(
     ticker: str,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Fetch data from Yahoo Finance for a ticker"""
     asset_data = await fetch_asset_data(ticker)
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from datetime import date, datetime
 from app.database import get_db
+from app.cache import conditional_response
 from app.schemas.movement import (
     Movement, MovementCreate, MovementUpdate, MovementWithClient, 
     MovementSummary, PeriodFilter, OfficeSummary
@@ -10,21 +11,24 @@ from app.schemas.movement import (
 from app.services.movement import (
     get_movements, get_movement, create_movement, update_movement,
     delete_movement, get_client_movements, get_movements_by_period,
-    get_movement_summary, get_office_summary, get_client_balance, export_client_movements_csv
+    get_movement_summary, get_office_summary, get_client_balance, stream_client_movements_csv
 )
-from app.auth.dependencies import get_current_active_user
+from app.services.client import get_client
+from app.auth.dependencies import get_current_user
 from app.models.user import User as UserModel
 from fastapi.responses import StreamingResponse
-import io
+import orjson
 
 router = APIRouter()
 
+MOVEMENT_DELETED_BODY = orjson.dumps({"message": "Movement deleted successfully"})
+
 @router.get("/", response_model=list[Movement])
 async def read_movements(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Get all movements with client information"""
     movements = await get_movements(db, skip=skip, limit=limit)
@@ -34,47 +38,52 @@ async def read_movements(
 async def create_new_movement(
     movement: MovementCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Create a new movement (deposit or withdrawal)"""
-    return await create_movement(db, movement)
+    db_movement = await create_movement(db, movement)
+    await db.commit()
+    return db_movement
 
 @router.get("/{movement_id}", response_model=Movement)
 async def read_movement(
+    request: Request,
     movement_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Get a specific movement by ID"""
     db_movement = await get_movement(db, movement_id)
     if db_movement is None:
         raise HTTPException(status_code=404, detail="Movement not found")
-    return db_movement
+    return conditional_response(request, Movement, db_movement)
 
 @router.put("/{movement_id}", response_model=Movement)
 async def update_existing_movement(
     movement_id: int,
     movement: MovementUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Update a movement"""
     db_movement = await update_movement(db, movement_id, movement)
     if db_movement is None:
         raise HTTPException(status_code=404, detail="Movement not found")
+    await db.commit()
     return db_movement
 
 @router.delete("/{movement_id}")
 async def delete_existing_movement(
     movement_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Delete a movement"""
     db_movement = await delete_movement(db, movement_id)
     if db_movement is None:
         raise HTTPException(status_code=404, detail="Movement not found")
-    return {"message": "Movement deleted successfully"}
+    await db.commit()
+    return Response(MOVEMENT_DELETED_BODY, media_type="application/json")
 
 @router.get("/client/{client_id}", response_model=list[Movement])
 async def read_client_movements(
@@ -82,7 +91,7 @@ async def read_client_movements(
     start_date: Optional[datetime] = Query(None, description="Start date for filtering"),
     end_date: Optional[datetime] = Query(None, description="End date for filtering"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Get all movements for a specific client with optional date range"""
     period_filter = PeriodFilter(
@@ -100,7 +109,7 @@ async def get_movements_summary(
     end_date: Optional[datetime] = Query(None, description="End date for filtering"),
     client_id: Optional[int] = Query(None, description="Filter by client ID"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Get summary of movements (deposits, withdrawals, net flow)"""
     period_filter = PeriodFilter(
@@ -116,7 +125,7 @@ async def get_office_summary_endpoint(
     start_date: Optional[date] = Query(None, description="Start date for filtering"),
     end_date: Optional[date] = Query(None, description="End date for filtering"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Get office-wide summary with breakdown by client"""
     period_filter = PeriodFilter(
@@ -131,7 +140,7 @@ async def get_client_current_balance(
     client_id: int,
     as_of_date: Optional[date] = Query(None, description="Get balance as of specific date"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Get client's current balance (total deposits - total withdrawals)"""
     balance = await get_client_balance(db, client_id, as_of_date)
@@ -148,7 +157,7 @@ async def export_client_movements_csv_endpoint(
     start_date: Optional[datetime] = Query(None, description="Start date for filtering"),
     end_date: Optional[datetime] = Query(None, description="End date for filtering"),
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     """Export client movements to CSV file"""
     period_filter = PeriodFilter(
@@ -157,25 +166,22 @@ async def export_client_movements_csv_endpoint(
         client_id=client_id
     )
     
-    try:
-        csv_file = await export_client_movements_csv(db, client_id, period_filter)
-        
-        # Create filename with timestamp
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        filename = f"movements_client_{client_id}_{timestamp}.csv"
-        
-        return StreamingResponse(
-            csv_file,
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}",
-                "Content-Type": "text/csv; charset=utf-8"
-            }
-        )
+    if await get_client(db, client_id) is None:
+        raise HTTPException(status_code=404, detail="Client not found")
     
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error generating CSV export: {str(e)}"
-        )
+    # Anything that can fail is checked above; once streaming starts the status is already sent
+    csv_rows = await stream_client_movements_csv(db, client_id, period_filter)
+    
+    # Create filename with timestamp
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    filename = f"movements_client_{client_id}_{timestamp}.csv"
+    
+    return StreamingResponse(
+        csv_rows,
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Content-Type": "text/csv; charset=utf-8"
+        }
+    )
 
@@ -1,18 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.cache import conditional_response
 from app.schemas.user import User, UserCreate, UserLogin, Token, UserUpdate
 from app.services.user import create_user, authenticate_user, get_users, get_user_by_id, update_user, delete_user
-from app.auth.dependencies import get_current_active_user
+from app.auth.dependencies import get_current_user, invalidate_user
 from app.auth.jwt import create_access_token
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User as UserModel
+import orjson
 
 router = APIRouter()
 
+USER_DELETED_BODY = orjson.dumps({"message": "User deleted successfully"})
+
 @router.post("/register", response_model=User)
 async def register(user: UserCreate, db: Session = Depends(get_db)):
     db_user = await create_user(db, user)
+    await db.commit()
     return db_user
 
 @router.post("/login", response_model=Token)
@@ -31,41 +36,49 @@ async def read_users(
     skip: int = 0, 
     limit: int = 100, 
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     users = await get_users(db, skip=skip, limit=limit)
     return users
 
 @router.get("/{user_id}", response_model=User)
 async def read_user(
+    request: Request,
     user_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
+    # The authenticated user was already loaded by the auth dependency
+    if current_user.id == user_id:
+        return conditional_response(request, User, current_user)
     db_user = await get_user_by_id(db, user_id)
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
-    return db_user
+    return conditional_response(request, User, db_user)
 
 @router.put("/{user_id}", response_model=User)
 async def update_user_route(
     user_id: int,
     user: UserUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     db_user = await update_user(db, user_id, user)
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
+    await db.commit()
+    invalidate_user(user_id)
     return db_user
 
 @router.delete("/{user_id}")
 async def delete_user_route(
     user_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_user)
 ):
     db_user = await delete_user(db, user_id)
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
-    return {"message": "User deleted successfully"}
\ No newline at end of file
+    await db.commit()
+    invalidate_user(user_id)
+    return Response(USER_DELETED_BODY, media_type="application/json")
\ No newline at end of file
@@ -4,9 +4,30 @@ from app.auth.jwt import verify_token
 from app.database import get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.user import get_user_by_email
+from app.schemas.user import User
+from cachetools import TTLCache
+import hashlib
+import time
 
 security = HTTPBearer()
 
+# token hash -> (user snapshot, exp, generation); lets repeat requests skip the user lookup.
+# The snapshot is a plain schema, since a rollback in the request session expires ORM instances.
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+# user id -> generation, bumped to make that user's cached entries stale
+_user_generations: dict[int, int] = {}
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+def invalidate_user(user_id: int):
+    """Make every cached token for the given user stale
+
+    The cache lives in process memory, so this only affects the current worker;
+    other workers keep serving their entries until the TTL expires them.
+    """
+    _user_generations[user_id] = _user_generations.get(user_id, 0) + 1
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
@@ -16,7 +37,15 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
+    key = _token_key(credentials.credentials)
+    cached = _user_cache.get(key)
+    if cached is not None:
+        user, exp, generation = cached
+        if (exp is None or exp > time.time()) and generation == _user_generations.get(user.id, 0):
+            return user
+        _user_cache.pop(key, None)
+
     try:
         payload = verify_token(credentials.credentials)
         email: str = payload.get("sub")
@@ -24,15 +53,14 @@ async def get_current_user(
             raise credentials_exception
     except Exception:
         raise credentials_exception
-    
-    user = await get_user_by_email(db, email=email)
-    if user is None:
-        raise credentials_exception
-    return user
 
-async def get_current_active_user(
-    current_user: dict = Depends(get_current_user)
-):
-    if not current_user.is_active:
+    db_user = await get_user_by_email(db, email=email)
+    if db_user is None:
+        raise credentials_exception
+    if not db_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user
\ No newline at end of file
+    
+    user = User.model_validate(db_user)
+
+    _user_cache[key] = (user, payload.get("exp"), _user_generations.get(user.id, 0))
+    return user
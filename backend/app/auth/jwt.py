@@ -3,12 +3,16 @@ from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from fastapi import HTTPException, status
 from app.schemas.user import Token
+import os
 
 SECRET_KEY = "your-secret-key-here"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# The test suite hashes many throwaway passwords; the minimum bcrypt cost keeps that cheap
+BCRYPT_ROUNDS = 4 if os.getenv("TESTING") else 12
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
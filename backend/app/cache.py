@@ -0,0 +1,34 @@
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
+from redis import asyncio as aioredis
+from fastapi import Request, Response
+from pydantic import BaseModel
+import hashlib
+import os
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+def api_key_builder(func, namespace: str = "", *, request=None, response=None, args=(), kwargs=None):
+    """Build a cache key from the endpoint arguments, ignoring the session and user"""
+    kwargs = dict(kwargs or {})
+    kwargs.pop("db", None)
+    kwargs.pop("current_user", None)
+    raw_key = f"{func.__module__}.{func.__name__}:{args}:{sorted(kwargs.items())}"
+    return f"{FastAPICache.get_prefix()}:{namespace}:{hashlib.md5(raw_key.encode()).hexdigest()}"
+
+def init_cache():
+    """Initialize the response cache, using Redis when REDIS_URL is set"""
+    if REDIS_URL:
+        backend = RedisBackend(aioredis.from_url(REDIS_URL))
+    else:
+        backend = InMemoryBackend()
+    FastAPICache.init(backend, prefix="investapp", key_builder=api_key_builder)
+
+def conditional_response(request: Request, schema: type[BaseModel], obj) -> Response:
+    """Serialize obj with an ETag, answering 304 when the client already has it"""
+    body = schema.model_validate(obj).model_dump_json().encode()
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
@@ -1,24 +1,93 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy import event, insert, update, delete
 from sqlalchemy.ext.declarative import declarative_base
 import os
 
 DATABASE_URL = os.getenv(
-    "DATABASE_URL", 
+    "DATABASE_URL",
     "postgresql+asyncpg://invest:investpw@db:5432/investdb"
 )
 
-engine = create_async_engine(DATABASE_URL, echo=True)
-AsyncSessionLocal = sessionmaker(
-    engine, 
-    class_=AsyncSession, 
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+
+engine_options = {
+    "echo": bool(os.getenv("SQL_ECHO")),
+    "query_cache_size": 1200,
+}
+
+BACKEND_NAME = make_url(DATABASE_URL).get_backend_name()
+
+# Pool sizing and statement caches only apply to the Postgres server setup
+if BACKEND_NAME == "postgresql":
+    engine_options.update(
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        connect_args={
+            "prepared_statement_cache_size": 500,
+            "statement_cache_size": 500,
+        },
+    )
+
+engine = create_async_engine(DATABASE_URL, **engine_options)
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection for concurrent reads and fewer fsyncs"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+if BACKEND_NAME == "sqlite":
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+
+AsyncSessionLocal = async_sessionmaker(
+    engine,
     expire_on_commit=False
 )
 Base = declarative_base()
 
 async def get_db():
+    """Yield one session per request, rolling back on errors
+
+    Write endpoints commit before returning: on this FastAPI version the code after
+    yield runs once the response is sent, too late to report a failed commit.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
+        except Exception:
+            await session.rollback()
+            raise
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+async def insert_returning(db, model, values: dict):
+    """INSERT a row and load it back, server defaults included, via RETURNING"""
+    result = await db.execute(insert(model).values(**values).returning(model))
+    return result.scalar_one()
+
+async def update_by_pk(db, model, pk, values: dict):
+    """Apply values with a single UPDATE ... RETURNING, or return None if no row matched"""
+    result = await db.execute(
+        update(model).where(model.id == pk).values(**values).returning(model)
+    )
+    obj = result.scalar_one_or_none()
+    return obj
+
+async def delete_by_pk(db, model, pk):
+    """Delete a row with a single DELETE ... RETURNING, or return None if no row matched"""
+    result = await db.execute(delete(model).where(model.id == pk).returning(model))
+    obj = result.scalar_one_or_none()
+    if obj is not None and obj in db:
+        # The deleted row stays in the identity map until commit, where db.get would still find it
+        db.expunge(obj)
+    return obj
@@ -1,8 +1,33 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from app.api import users, clients, assets, allocations, movements
+from app.database import engine, POOL_SIZE
+from app.cache import init_cache
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
+from sqlalchemy import text
+import asyncio
+import orjson
 
-app = FastAPI(title="Investmentpw API", version="1.0.0")
+async def _open_connection():
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Fill the pool before serving so the first requests skip the handshake
+    await asyncio.gather(*(_open_connection() for _ in range(POOL_SIZE)))
+    init_cache()
+    yield
+    await engine.dispose()
+
+app = FastAPI(
+    title="Investmentpw API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 origins = [
     "http://localhost:3000",  
@@ -14,9 +39,12 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    expose_headers=["ETag", "Content-Disposition"],
+    max_age=86400,
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 app.include_router(users.router, prefix="/auth", tags=["authentication"])
 app.include_router(clients.router, prefix="/clients", tags=["clients"])
@@ -24,6 +52,8 @@ app.include_router(assets.router, prefix="/assets", tags=["assets"])
 app.include_router(allocations.router, prefix="/allocations", tags=["allocations"])
 app.include_router(movements.router, prefix="/movements", tags=["movements"])
 
+ROOT_BODY = orjson.dumps({"message": "Investmentpw API"})
+
 @app.get("/")
-def read_root():
-    return {"message": "Investmentpw API"}
\ No newline at end of file
+async def read_root():
+    return Response(ROOT_BODY, media_type="application/json")
\ No newline at end of file
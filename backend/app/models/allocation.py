@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Numeric, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, Numeric, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -12,5 +12,9 @@ class Allocation(Base):
     buy_price = Column(Numeric(15, 2), nullable=False)
     buy_date = Column(DateTime(timezone=True), nullable=False)
 
+    __table_args__ = (
+        Index("ix_allocations_client_asset", client_id, asset_id),
+    )
+
     client = relationship("Client")
-    asset = relationship("Asset")
\ No newline at end of file
+    asset = relationship("Asset")
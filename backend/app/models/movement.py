@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, String, Numeric, DateTime, Enum
+from sqlalchemy import Column, Integer, ForeignKey, String, Numeric, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 import enum
@@ -17,4 +17,12 @@ class Movement(Base):
     date = Column(DateTime(timezone=True), nullable=False)
     note = Column(String, nullable=True)
 
+    __table_args__ = (
+        # Covers the client/date scans used by listings, balances, summaries and exports
+        Index(
+            "ix_movements_client_date_covering", client_id, date.desc(),
+            postgresql_include=["type", "amount"],
+        ),
+    )
+
     client = relationship("Client")
\ No newline at end of file
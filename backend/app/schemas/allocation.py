@@ -1,4 +1,4 @@
-from pydantic import BaseModel, condecimal
+from pydantic import BaseModel, condecimal, ConfigDict
 from datetime import datetime
 from typing import Optional
 from decimal import Decimal
@@ -13,6 +13,13 @@ class AllocationBase(BaseModel):
 class AllocationCreate(AllocationBase):
     pass
 
+class AllocationImport(BaseModel):
+    client_id: int
+    ticker: str
+    quantity: condecimal(max_digits=15, decimal_places=6)
+    buy_price: condecimal(max_digits=15, decimal_places=2)
+    buy_date: datetime
+
 class AllocationUpdate(BaseModel):
     quantity: Optional[condecimal(max_digits=15, decimal_places=6)] = None
     buy_price: Optional[condecimal(max_digits=15, decimal_places=2)] = None
@@ -21,8 +28,7 @@ class AllocationUpdate(BaseModel):
 class Allocation(AllocationBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class AllocationWithAsset(Allocation):
     asset_ticker: str
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, condecimal
+from pydantic import BaseModel, condecimal, ConfigDict
 from typing import Optional
 from decimal import Decimal
 
@@ -20,8 +20,7 @@ class AssetUpdate(BaseModel):
 class Asset(AssetBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class YahooFinanceResponse(BaseModel):
     ticker: str
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, condecimal
+from pydantic import BaseModel, condecimal, ConfigDict
 from datetime import datetime
 from typing import Optional
 from decimal import Decimal
@@ -27,8 +27,7 @@ class MovementUpdate(BaseModel):
 class Movement(MovementBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class MovementWithClient(Movement):
     client_name: str
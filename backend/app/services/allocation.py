@@ -1,46 +1,55 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, bindparam, insert
 from app.models.allocation import Allocation
 from app.models.asset import Asset
-from app.schemas.allocation import AllocationCreate, AllocationUpdate
-from app.services.asset import get_asset_by_ticker, create_asset_from_ticker, get_asset
+from app.schemas.allocation import Allocation as AllocationSchema, AllocationCreate, AllocationImport, AllocationUpdate, AllocationWithAsset
+from app.services.asset import get_asset_by_ticker, create_asset_from_ticker, get_asset, resolve_asset_ids
 from typing import List, Optional
+from app.database import insert_returning, update_by_pk, delete_by_pk
+
+# Statements are built once so repeated lookups reuse the same compiled form
+_ALLOCATION_BY_ID = select(Allocation).where(Allocation.id == bindparam("allocation_id"))
 
 async def get_allocations(db: AsyncSession, skip: int = 0, limit: int = 100):
-    """Get all allocations with pagination"""
+    """Get all allocations with pagination, projected straight into response schemas"""
     result = await db.execute(
-        select(Allocation)
+        select(
+            Allocation.id,
+            Allocation.client_id,
+            Allocation.asset_id,
+            Allocation.quantity,
+            Allocation.buy_price,
+            Allocation.buy_date
+        )
         .offset(skip)
         .limit(limit)
     )
-    return result.scalars().all()
+    return [AllocationSchema.model_construct(**row._mapping) for row in result]
 
 async def get_allocation(db: AsyncSession, allocation_id: int):
     """Get allocation by ID"""
-    result = await db.execute(
-        select(Allocation).where(Allocation.id == allocation_id)
-    )
+    result = await db.execute(_ALLOCATION_BY_ID, {"allocation_id": allocation_id})
     return result.scalar_one_or_none()
 
 async def get_client_allocations(db: AsyncSession, client_id: int):
-    """Get all allocations for a specific client"""
+    """Get all allocations for a specific client, with their asset fields, in one query"""
     result = await db.execute(
-        select(Allocation, Asset)
+        select(
+            Allocation.id,
+            Allocation.client_id,
+            Allocation.asset_id,
+            Allocation.quantity,
+            Allocation.buy_price,
+            Allocation.buy_date,
+            Asset.ticker.label("asset_ticker"),
+            Asset.name.label("asset_name"),
+            Asset.exchange.label("asset_exchange"),
+            Asset.currency.label("asset_currency")
+        )
         .join(Asset, Allocation.asset_id == Asset.id)
         .where(Allocation.client_id == client_id)
     )
-    
-    allocations_with_assets = []
-    for allocation, asset in result:
-        allocation_with_asset = allocation
-        allocation_with_asset.asset_ticker = asset.ticker
-        allocation_with_asset.asset_name = asset.name
-        allocation_with_asset.asset_exchange = asset.exchange
-        allocation_with_asset.asset_currency = asset.currency
-        
-        allocations_with_assets.append(allocation_with_asset)
-    
-    return allocations_with_assets
+    return [AllocationWithAsset.model_construct(**row._mapping) for row in result]
 
 async def create_allocation(db: AsyncSession, allocation: AllocationCreate):
     """Create a new allocation"""
@@ -60,47 +69,59 @@ async def create_allocation(db: AsyncSession, allocation: AllocationCreate):
         return None  # No asset ID or ticker provided
     
     # Create allocation
-    db_allocation = Allocation(
-        client_id=allocation.client_id,
-        asset_id=asset_id,
-        quantity=allocation.quantity,
-        buy_price=allocation.buy_price,
-        buy_date=allocation.buy_date
-    )
+    return await insert_returning(db, Allocation, {
+        "client_id": allocation.client_id,
+        "asset_id": asset_id,
+        "quantity": allocation.quantity,
+        "buy_price": allocation.buy_price,
+        "buy_date": allocation.buy_date
+    })
+
+async def create_allocations_bulk(db: AsyncSession, items: List[AllocationImport]):
+    """Create many allocations in one transaction, resolving their tickers in bulk (no commit)
+
+    Raises ValueError when a ticker cannot be resolved; the caller's rollback then
+    discards any assets created along the way.
+    """
+    if not items:
+        return []
     
-    db.add(db_allocation)
-    await db.commit()
-    await db.refresh(db_allocation)
-    return db_allocation
+    asset_ids = await resolve_asset_ids(db, [item.ticker for item in items])
+    unknown = sorted({item.ticker.upper() for item in items} - asset_ids.keys())
+    if unknown:
+        raise ValueError(f"Could not resolve tickers: {', '.join(unknown)}")
+    
+    result = await db.execute(
+        insert(Allocation).returning(Allocation),
+        [
+            {
+                "client_id": item.client_id,
+                "asset_id": asset_ids[item.ticker.upper()],
+                "quantity": item.quantity,
+                "buy_price": item.buy_price,
+                "buy_date": item.buy_date
+            }
+            for item in items
+        ]
+    )
+    return result.scalars().all()
 
 async def update_allocation(db: AsyncSession, allocation_id: int, allocation: AllocationUpdate):
     """Update allocation information"""
-    db_allocation = await get_allocation(db, allocation_id)
-    if not db_allocation:
-        return None
-    
     update_data = allocation.model_dump(exclude_unset=True)
     filtered_update_data = {
         k: v for k, v in update_data.items() 
         if v is not None and v != ""
     }
     
-    for field, value in filtered_update_data.items():
-        setattr(db_allocation, field, value)
+    if not filtered_update_data:
+        return await get_allocation(db, allocation_id)
     
-    await db.commit()
-    await db.refresh(db_allocation)
-    return db_allocation
+    return await update_by_pk(db, Allocation, allocation_id, filtered_update_data)
 
 async def delete_allocation(db: AsyncSession, allocation_id: int):
     """Delete an allocation"""
-    db_allocation = await get_allocation(db, allocation_id)
-    if not db_allocation:
-        return None
-    
-    await db.delete(db_allocation)
-    await db.commit()
-    return db_allocation
+    return await delete_by_pk(db, Allocation, allocation_id)
 
 async def get_client_allocation_by_asset(db: AsyncSession, client_id: int, asset_id: int):
     """Get specific allocation for a client and asset"""
@@ -1,9 +1,15 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.models.asset import Asset
 from app.schemas.asset import AssetCreate, AssetUpdate
-from app.services.yahoo_finance import fetch_asset_data
+from app.services.yahoo_finance import fetch_asset_data, fetch_assets_bulk
 from typing import Optional
+from app.database import update_by_pk, delete_by_pk
+
+# Statements are built once so repeated lookups reuse the same compiled form
+_ASSET_BY_TICKER = select(Asset).where(Asset.ticker == bindparam("ticker"))
 
 async def get_assets(db: AsyncSession, skip: int = 0, limit: int = 100):
     """Get all assets with pagination"""
@@ -12,27 +18,37 @@ async def get_assets(db: AsyncSession, skip: int = 0, limit: int = 100):
 
 async def get_asset(db: AsyncSession, asset_id: int):
     """Get asset by ID"""
-    result = await db.execute(select(Asset).where(Asset.id == asset_id))
-    return result.scalar_one_or_none()
+    return await db.get(Asset, asset_id)
 
 async def get_asset_by_ticker(db: AsyncSession, ticker: str):
     """Get asset by ticker"""
-    result = await db.execute(select(Asset).where(Asset.ticker == ticker.upper()))
+    result = await db.execute(_ASSET_BY_TICKER, {"ticker": ticker.upper()})
     return result.scalar_one_or_none()
 
-async def create_asset(db: AsyncSession, asset: AssetCreate):
-    """Create a new asset"""
-    # Check if asset already exists
-    existing_asset = await get_asset_by_ticker(db, asset.ticker)
-    if existing_asset:
-        return existing_asset
-    
-    db_asset = Asset(**asset.model_dump())
-    db.add(db_asset)
-    await db.commit()
-    await db.refresh(db_asset)
+def _asset_insert(db: AsyncSession):
+    # ON CONFLICT is dialect-specific; tests run on SQLite, production on Postgres
+    insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    return insert(Asset)
+
+async def _insert_asset(db: AsyncSession, values: dict):
+    """Insert an asset unless its ticker already exists, returning whichever row wins"""
+    result = await db.execute(
+        _asset_insert(db)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=[Asset.ticker])
+        .returning(Asset)
+    )
+    db_asset = result.scalar_one_or_none()
+    if db_asset is None:
+        return await get_asset_by_ticker(db, values["ticker"])
     return db_asset
 
+async def create_asset(db: AsyncSession, asset: AssetCreate):
+    """Create a new asset, returning the existing one if the ticker is taken"""
+    values = asset.model_dump()
+    values["ticker"] = values["ticker"].upper()
+    return await _insert_asset(db, values)
+
 async def create_asset_from_ticker(db: AsyncSession, ticker: str):
     """Create asset from Yahoo Finance data"""
     # Check if asset already exists
@@ -45,51 +61,63 @@ async def create_asset_from_ticker(db: AsyncSession, ticker: str):
     if not asset_data:
         return None
     
-    # Create asset
-    db_asset = Asset(
-        ticker=asset_data.ticker,
-        name=asset_data.name,
-        exchange=asset_data.exchange,
-        currency=asset_data.currency
-    )
+    # Another request may have created it while Yahoo was being queried
+    return await _insert_asset(db, {
+        "ticker": asset_data.ticker,
+        "name": asset_data.name,
+        "exchange": asset_data.exchange,
+        "currency": asset_data.currency
+    })
+
+async def resolve_asset_ids(db: AsyncSession, tickers: list[str]) -> dict[str, int]:
+    """Map tickers to asset ids, creating missing assets from one Yahoo Finance batch (no commit)"""
+    tickers = list({ticker.upper() for ticker in tickers})
+    result = await db.execute(select(Asset.ticker, Asset.id).where(Asset.ticker.in_(tickers)))
+    asset_ids = dict(result.all())
     
-    db.add(db_asset)
-    await db.commit()
-    await db.refresh(db_asset)
-    return db_asset
+    missing = [ticker for ticker in tickers if ticker not in asset_ids]
+    if not missing:
+        return asset_ids
+    
+    fetched = await fetch_assets_bulk(missing)
+    if fetched:
+        await db.execute(
+            _asset_insert(db)
+            .values([
+                {
+                    "ticker": asset_data.ticker,
+                    "name": asset_data.name,
+                    "exchange": asset_data.exchange,
+                    "currency": asset_data.currency
+                }
+                for asset_data in fetched.values()
+            ])
+            .on_conflict_do_nothing(index_elements=[Asset.ticker])
+        )
+        result = await db.execute(select(Asset.ticker, Asset.id).where(Asset.ticker.in_(list(fetched))))
+        asset_ids.update(result.all())
+    return asset_ids
 
 async def update_asset(db: AsyncSession, asset_id: int, asset: AssetUpdate):
     """Update asset information"""
-    db_asset = await get_asset(db, asset_id)
-    if not db_asset:
-        return None
-    
     update_data = asset.model_dump(exclude_unset=True)
     filtered_update_data = {
         k: v for k, v in update_data.items() 
         if v is not None and v != ""
     }
     
-    for field, value in filtered_update_data.items():
-        setattr(db_asset, field, value)
+    if not filtered_update_data:
+        return await get_asset(db, asset_id)
     
-    await db.commit()
-    await db.refresh(db_asset)
-    return db_asset
+    return await update_by_pk(db, Asset, asset_id, filtered_update_data)
 
 async def delete_asset(db: AsyncSession, asset_id: int):
     """Delete an asset"""
-    db_asset = await get_asset(db, asset_id)
-    if not db_asset:
-        return None
-    
-    await db.delete(db_asset)
-    await db.commit()
-    return db_asset
+    return await delete_by_pk(db, Asset, asset_id)
 
 async def search_assets_by_ticker(db: AsyncSession, ticker: str):
-    """Search assets by ticker (partial match)"""
+    """Search assets by ticker prefix"""
     result = await db.execute(
-        select(Asset).where(Asset.ticker.ilike(f"%{ticker}%"))
+        select(Asset).where(Asset.ticker.ilike(f"{ticker}%"))
     )
     return result.scalars().all()
\ No newline at end of file
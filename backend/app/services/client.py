@@ -2,40 +2,28 @@ from sqlalchemy.orm import Session
 from app.models.client import Client
 from app.schemas.client import ClientCreate, ClientUpdate, ClientSearch
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, text
 from typing import Optional
+from app.database import insert_returning, update_by_pk, delete_by_pk
 
 async def get_clients(db: AsyncSession, skip: int = 0, limit: int = 100):
     result = await db.execute(select(Client).offset(skip).limit(limit))
     return result.scalars().all()
 
 async def create_client(db: AsyncSession, client: ClientCreate):
-    db_client = Client(**client.model_dump())
-    db.add(db_client)
-    await db.commit()
-    await db.refresh(db_client)
-    return db_client
+    return await insert_returning(db, Client, client.model_dump())
 
 async def get_client(db: Session, client_id: int):
-    result = await db.execute(select(Client).where(Client.id == client_id))
-    return result.scalar_one_or_none()
+    return await db.get(Client, client_id)
 
 async def update_client(db: Session, client_id: int, client: ClientUpdate):
-    db_client = await get_client(db, client_id)
-    if db_client:
-        update_data = client.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_client, field, value)
-        await db.commit()
-        await db.refresh(db_client)
-    return db_client
+    update_data = client.model_dump(exclude_unset=True)
+    if not update_data:
+        return await get_client(db, client_id)
+    return await update_by_pk(db, Client, client_id, update_data)
 
 async def delete_client(db: Session, client_id: int):
-    db_client = await get_client(db, client_id)
-    if db_client:
-        await db.delete(db_client)
-        await db.commit()
-    return db_client
+    return await delete_by_pk(db, Client, client_id)
 
 async def search_clients(db: AsyncSession, search: ClientSearch):
     """Search clients with filters and pagination"""
@@ -58,11 +46,24 @@ async def search_clients(db: AsyncSession, search: ClientSearch):
     return result.scalars().all()
 
 async def get_clients_count(db: AsyncSession, is_active: Optional[bool] = None):
-    """Get total count of clients, optionally filtered by status"""
-    query = select(Client)
+    """Get total count of clients, optionally filtered by status
+
+    On Postgres the unfiltered total is the planner's row estimate, so it is approximate.
+    """
+    if is_active is None and db.bind.dialect.name == "postgresql":
+        # The planner estimate is good enough for the unfiltered stats count;
+        # it reads 0 (or -1) until the table is analysed, so count exactly then
+        result = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'clients'")
+        )
+        estimate = result.scalar_one_or_none()
+        if estimate is not None and estimate > 0:
+            return estimate
+    
+    query = select(func.count()).select_from(Client)
     
     if is_active is not None:
         query = query.where(Client.is_active == is_active)
     
     result = await db.execute(query)
-    return len(result.scalars().all())
\ No newline at end of file
+    return result.scalar_one()
\ No newline at end of file
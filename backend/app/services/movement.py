@@ -1,76 +1,69 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, func, and_, case, bindparam
+from sqlalchemy.orm import joinedload, raiseload
 from app.models.movement import Movement, MovementType
 from app.models.client import Client
-from app.schemas.movement import MovementCreate, MovementUpdate, MovementSummary, PeriodFilter, OfficeSummary
-from typing import List, Optional
+from app.schemas.movement import Movement as MovementSchema, MovementCreate, MovementUpdate, MovementSummary, PeriodFilter, OfficeSummary
+from typing import AsyncIterator, List, Optional
 from decimal import Decimal
 from datetime import datetime
+from app.database import insert_returning, update_by_pk, delete_by_pk
 import csv
 import io
 
+# Statements are built once so repeated lookups reuse the same compiled form
+_MOVEMENT_BY_ID = (
+    select(Movement)
+    .options(joinedload(Movement.client))
+    .where(Movement.id == bindparam("movement_id"))
+)
+
 async def get_movements(db: AsyncSession, skip: int = 0, limit: int = 100):
-    """Get all movements with pagination"""
+    """Get all movements with pagination, projected straight into response schemas"""
     result = await db.execute(
-        select(Movement)
-        .options(joinedload(Movement.client))
+        select(
+            Movement.id,
+            Movement.client_id,
+            Movement.type,
+            Movement.amount,
+            Movement.date,
+            Movement.note
+        )
         .offset(skip)
         .limit(limit)
         .order_by(Movement.date.desc())
     )
-    return result.scalars().all()
+    return [MovementSchema.model_construct(**row._mapping) for row in result]
 
 async def get_movement(db: AsyncSession, movement_id: int):
     """Get movement by ID"""
-    result = await db.execute(
-        select(Movement)
-        .options(joinedload(Movement.client))
-        .where(Movement.id == movement_id)
-    )
+    result = await db.execute(_MOVEMENT_BY_ID, {"movement_id": movement_id})
     return result.scalar_one_or_none()
 
 async def create_movement(db: AsyncSession, movement: MovementCreate):
     """Create a new movement"""
-    db_movement = Movement(**movement.model_dump())
-    db.add(db_movement)
-    await db.commit()
-    await db.refresh(db_movement)
-
-    return db_movement
+    return await insert_returning(db, Movement, movement.model_dump())
 
 async def update_movement(db: AsyncSession, movement_id: int, movement: MovementUpdate):
     """Update movement information"""
-    db_movement = await get_movement(db, movement_id)
-    if not db_movement:
-        return None
-    
     update_data = movement.model_dump(exclude_unset=True)
     filtered_update_data = {
         k: v for k, v in update_data.items() 
         if v is not None and v != ""
     }
     
-    for field, value in filtered_update_data.items():
-        setattr(db_movement, field, value)
+    if not filtered_update_data:
+        return await get_movement(db, movement_id)
     
-    await db.commit()
-    await db.refresh(db_movement)
-    return db_movement
+    return await update_by_pk(db, Movement, movement_id, filtered_update_data)
 
 async def delete_movement(db: AsyncSession, movement_id: int):
     """Delete a movement"""
-    db_movement = await get_movement(db, movement_id)
-    if not db_movement:
-        return None
-    
-    await db.delete(db_movement)
-    await db.commit()
-    return db_movement
+    return await delete_by_pk(db, Movement, movement_id)
 
 async def get_client_movements(db: AsyncSession, client_id: int, period_filter: Optional[PeriodFilter] = None):
     """Get all movements for a specific client with optional period filter"""
-    query = select(Movement).where(Movement.client_id == client_id)
+    query = select(Movement).options(raiseload("*")).where(Movement.client_id == client_id)
     
     if period_filter:
         if period_filter.start_date:
@@ -84,7 +77,7 @@ async def get_client_movements(db: AsyncSession, client_id: int, period_filter:
 
 async def get_movements_by_period(db: AsyncSession, period_filter: PeriodFilter):
     """Get movements filtered by period and optionally by client"""
-    query = select(Movement).options(joinedload(Movement.client))
+    query = select(Movement).options(joinedload(Movement.client), raiseload("*"))
     
     # Apply date filters
     if period_filter.start_date:
@@ -100,9 +93,21 @@ async def get_movements_by_period(db: AsyncSession, period_filter: PeriodFilter)
     result = await db.execute(query)
     return result.scalars().all()
 
+def _movement_totals():
+    """Aggregate columns for deposit/withdrawal totals and movement count"""
+    return (
+        func.coalesce(
+            func.sum(case((Movement.type == MovementType.deposit, Movement.amount), else_=0)), 0
+        ).label("total_deposits"),
+        func.coalesce(
+            func.sum(case((Movement.type == MovementType.withdrawal, Movement.amount), else_=0)), 0
+        ).label("total_withdrawals"),
+        func.count(Movement.id).label("movement_count"),
+    )
+
 async def get_movement_summary(db: AsyncSession, period_filter: Optional[PeriodFilter] = None) -> MovementSummary:
     """Get summary of movements (deposits, withdrawals, net flow)"""
-    query = select(Movement)
+    query = select(*_movement_totals())
     
     # Apply filters if provided
     if period_filter:
@@ -113,84 +118,89 @@ async def get_movement_summary(db: AsyncSession, period_filter: Optional[PeriodF
         if period_filter.client_id:
             query = query.where(Movement.client_id == period_filter.client_id)
     
-    # Get all movements matching the filter
     result = await db.execute(query)
-    movements = result.scalars().all()
-    
-    # Calculate totals
-    total_deposits = Decimal('0')
-    total_withdrawals = Decimal('0')
-    
-    for movement in movements:
-        if movement.type == MovementType.deposit:
-            total_deposits += movement.amount
-        else:
-            total_withdrawals += movement.amount
-    
-    net_flow = total_deposits - total_withdrawals
+    totals = result.one()
     
     return MovementSummary(
-        total_deposits=total_deposits,
-        total_withdrawals=total_withdrawals,
-        net_flow=net_flow,
-        movement_count=len(movements)
+        total_deposits=totals.total_deposits,
+        total_withdrawals=totals.total_withdrawals,
+        net_flow=totals.total_deposits - totals.total_withdrawals,
+        movement_count=totals.movement_count
     )
 
 async def get_office_summary(db: AsyncSession, period_filter: Optional[PeriodFilter] = None) -> OfficeSummary:
     """Get office-wide summary with breakdown by client"""
-    # Get overall summary
-    overall_summary = await get_movement_summary(db, period_filter)
+    # Period filters go in the join so clients without movements still get a row
+    join_condition = [Movement.client_id == Client.id]
+    client_id = None
     
-    # Get all clients
-    clients_result = await db.execute(select(Client))
-    clients = clients_result.scalars().all()
+    if period_filter:
+        if period_filter.start_date:
+            join_condition.append(Movement.date >= period_filter.start_date)
+        if period_filter.end_date:
+            join_condition.append(Movement.date <= period_filter.end_date)
+        client_id = period_filter.client_id
     
-    # Get summary for each client
+    # A client filter narrows the office totals only; every client keeps its breakdown row
+    query = (
+        select(Client.id, Client.name, Client.email, *_movement_totals())
+        .outerjoin(Movement, and_(*join_condition))
+        .group_by(Client.id, Client.name, Client.email)
+    )
+    result = await db.execute(query)
+    
+    total_deposits = Decimal('0')
+    total_withdrawals = Decimal('0')
+    total_movements = 0
     client_summaries = {}
-    for client in clients:
-        client_filter = PeriodFilter(
-            start_date=period_filter.start_date if period_filter else None,
-            end_date=period_filter.end_date if period_filter else None,
-            client_id=client.id
-        )
-        client_summary = await get_movement_summary(db, client_filter)
-        client_summaries[client.id] = {
-            "client_name": client.name,
-            "client_email": client.email,
-            "summary": client_summary
+    
+    for row in result:
+        if not client_id or row.id == client_id:
+            total_deposits += row.total_deposits
+            total_withdrawals += row.total_withdrawals
+            total_movements += row.movement_count
+        client_summaries[row.id] = {
+            "client_name": row.name,
+            "client_email": row.email,
+            "summary": MovementSummary(
+                total_deposits=row.total_deposits,
+                total_withdrawals=row.total_withdrawals,
+                net_flow=row.total_deposits - row.total_withdrawals,
+                movement_count=row.movement_count
+            )
         }
     
     return OfficeSummary(
-        total_deposits=overall_summary.total_deposits,
-        total_withdrawals=overall_summary.total_withdrawals,
-        net_flow=overall_summary.net_flow,
-        total_movements=overall_summary.movement_count,
+        total_deposits=total_deposits,
+        total_withdrawals=total_withdrawals,
+        net_flow=total_deposits - total_withdrawals,
+        total_movements=total_movements,
         client_summaries=client_summaries
     )
 
 async def get_client_balance(db: AsyncSession, client_id: int, as_of_date: Optional[datetime] = None) -> Decimal:
     """Get client's current balance (total deposits - total withdrawals)"""
-    query = select(Movement).where(Movement.client_id == client_id)
+    signed_amount = case((Movement.type == MovementType.deposit, Movement.amount), else_=-Movement.amount)
+    query = select(func.coalesce(func.sum(signed_amount), 0)).where(Movement.client_id == client_id)
     
     if as_of_date:
         query = query.where(Movement.date <= as_of_date)
     
     result = await db.execute(query)
-    movements = result.scalars().all()
-    
-    balance = Decimal('0')
-    for movement in movements:
-        if movement.type == MovementType.deposit:
-            balance += movement.amount
-        else:
-            balance -= movement.amount
-    
-    return balance
+    return Decimal(result.scalar_one())
 
-async def export_client_movements_csv(db: AsyncSession, client_id: int, period_filter: Optional[PeriodFilter] = None) -> io.StringIO:
-    """Export client movements to CSV format"""
-    # Use async query with proper relationship loading
-    query = select(Movement).options(joinedload(Movement.client)).where(Movement.client_id == client_id)
+CSV_HEADER = [
+    'ID', 'Date', 'Type', 'Amount', 'Currency', 'Note',
+    'Client Name', 'Client Email', 'Created At'
+]
+
+def _client_movements_csv_query(client_id: int, period_filter: Optional[PeriodFilter] = None):
+    """Build the query used by the CSV exports"""
+    query = (
+        select(Movement)
+        .options(joinedload(Movement.client), raiseload("*"))
+        .where(Movement.client_id == client_id)
+    )
     
     if period_filter:
         if period_filter.start_date:
@@ -198,33 +208,49 @@ async def export_client_movements_csv(db: AsyncSession, client_id: int, period_f
         if period_filter.end_date:
             query = query.where(Movement.date <= period_filter.end_date)
     
-    query = query.order_by(Movement.date.desc())
-    result = await db.execute(query)
-    movements = result.scalars().all()
-    
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow([
-        'ID', 'Date', 'Type', 'Amount', 'Currency', 'Note',
-        'Client Name', 'Client Email', 'Created At'
-    ])
-    
-    # Write data rows
-    for movement in movements:
-        writer.writerow([
-            movement.id,
-            movement.date.strftime('%Y-%m-%d %H:%M:%S'),
-            movement.type.value,
-            float(movement.amount),
-            'BRL',  # You might want to make this dynamic based on your data
-            movement.note or '',
-            movement.client.name if movement.client else '',
-            movement.client.email if movement.client else '',
-            movement.date.strftime('%Y-%m-%d %H:%M:%S')
-        ])
-    
-    output.seek(0)
-    return output
\ No newline at end of file
+    return query.order_by(Movement.date.desc())
+
+# Movements carry no currency column yet; every amount is recorded in reais
+CSV_CURRENCY = 'BRL'
+
+def _movement_csv_row(movement: Movement) -> tuple:
+    date = movement.date.strftime('%Y-%m-%d %H:%M:%S')
+    client = movement.client
+    return (
+        movement.id,
+        date,
+        movement.type.value,
+        float(movement.amount),
+        CSV_CURRENCY,
+        movement.note or '',
+        client.name if client else '',
+        client.email if client else '',
+        date
+    )
+
+CSV_STREAM_BATCH_SIZE = 1000
+
+def _csv_line(row: list) -> str:
+    line = io.StringIO()
+    csv.writer(line).writerow(row)
+    return line.getvalue()
+
+async def _iter_movements_csv(partitions) -> AsyncIterator[str]:
+    yield _csv_line(CSV_HEADER)
+    
+    # One chunk per fetched batch, reusing a single buffer
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    async for movements in partitions:
+        writer.writerows(_movement_csv_row(movement) for movement in movements)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+async def stream_client_movements_csv(db: AsyncSession, client_id: int, period_filter: Optional[PeriodFilter] = None) -> AsyncIterator[str]:
+    """Stream client movements as CSV chunks from a server-side cursor"""
+    movements = await db.stream_scalars(
+        _client_movements_csv_query(client_id, period_filter),
+        execution_options={"yield_per": CSV_STREAM_BATCH_SIZE}
+    )
+    return _iter_movements_csv(movements.partitions())
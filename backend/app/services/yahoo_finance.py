@@ -1,30 +1,70 @@
 import yfinance as yf
 from app.schemas.asset import YahooFinanceResponse
+from cachetools import TTLCache
+from collections import defaultdict
 from typing import Optional
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Uppercased ticker -> YahooFinanceResponse; only successful lookups are cached
+_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
 async def fetch_asset_data(ticker: str) -> Optional[YahooFinanceResponse]:
+    """Fetch asset data from Yahoo Finance, reusing recent results for the same ticker"""
+    key = ticker.upper()
+    if key in _cache:
+        return _cache[key]
+    
+    # Concurrent misses for the same ticker wait for a single upstream call
+    lock = _locks[key]
+    async with lock:
+        if key in _cache:
+            return _cache[key]
+        asset_data = await _fetch_asset_data(ticker)
+        if asset_data is not None:
+            _cache[key] = asset_data
+        # Drop the lock while still holding it, and never a newer one another task installed
+        if _locks.get(key) is lock:
+            del _locks[key]
+    return asset_data
+
+def _fetch_info(ticker: str) -> dict:
+    """Blocking yfinance lookup; run it in a worker thread"""
+    return yf.Ticker(ticker).info
+
+def _to_response(ticker: str, info: dict) -> YahooFinanceResponse:
+    return YahooFinanceResponse(
+        ticker=ticker.upper(),
+        name=info.get('longName', ticker),
+        exchange=info.get('exchange', 'Unknown'),
+        currency=info.get('currency', 'USD'),
+        current_price=info.get('currentPrice') or info.get('regularMarketPrice')
+    )
+
+async def _fetch_asset_data(ticker: str) -> Optional[YahooFinanceResponse]:
     """Fetch asset data from Yahoo Finance API"""
     try:
-        stock = yf.Ticker(ticker)
-        print(stock)
-        info = stock.info
-        
-        asset_data = YahooFinanceResponse(
-            ticker=ticker.upper(),
-            name=info.get('longName', ticker),
-            exchange=info.get('exchange', 'Unknown'),
-            currency=info.get('currency', 'USD'),
-            current_price=info.get('currentPrice') or info.get('regularMarketPrice')
-        )
-        
-        return asset_data
+        # yfinance does synchronous HTTP, so keep it off the event loop
+        info = await asyncio.to_thread(_fetch_info, ticker)
+        return _to_response(ticker, info)
     except Exception as e:
         logger.error(f"Error fetching data for ticker {ticker}: {e}")
         return None
 
+async def fetch_assets_bulk(tickers: list[str]) -> dict[str, YahooFinanceResponse]:
+    """Fetch several tickers concurrently, only asking Yahoo Finance for the uncached ones
+
+    yfinance has no batch call for quote metadata (name, exchange, currency), so each
+    ticker is still its own HTTP request; they run side by side in worker threads
+    instead of one after another. Tickers that fail are logged and left out.
+    """
+    keys = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+    fetched = await asyncio.gather(*(fetch_asset_data(key) for key in keys))
+    return {key: asset_data for key, asset_data in zip(keys, fetched) if asset_data is not None}
+
 async def search_assets(ticker: str) -> list[YahooFinanceResponse]:
     """Search for assets by ticker"""
     assets = []
@@ -0,0 +1,36 @@
+"""Add partial index on active clients
+
+Revision ID: 3c1d2e4f5a6b
+Revises: bf8f4149075a
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1d2e4f5a6b'
+down_revision: Union[str, None] = 'bf8f4149075a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_clients_is_active', 'clients', ['is_active'], unique=False,
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_clients_is_active', table_name='clients',
+            postgresql_concurrently=True,
+        )
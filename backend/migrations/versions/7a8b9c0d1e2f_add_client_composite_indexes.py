@@ -0,0 +1,43 @@
+"""Add composite indexes for client movement and allocation lookups
+
+Revision ID: 7a8b9c0d1e2f
+Revises: 3c1d2e4f5a6b
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a8b9c0d1e2f'
+down_revision: Union[str, None] = '3c1d2e4f5a6b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_movements_client_date', 'movements', ['client_id', sa.text('date DESC')], unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_allocations_client_asset', 'allocations', ['client_id', 'asset_id'], unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_allocations_client_asset', table_name='allocations',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_movements_client_date', table_name='movements',
+            postgresql_concurrently=True,
+        )
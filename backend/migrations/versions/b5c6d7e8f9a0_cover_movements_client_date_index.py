@@ -0,0 +1,46 @@
+"""Replace the movements client/date index with a covering one
+
+Revision ID: b5c6d7e8f9a0
+Revises: 9e4f1a2b3c4d
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5c6d7e8f9a0'
+down_revision: Union[str, None] = '9e4f1a2b3c4d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build the replacement first so client queries always have an index
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_movements_client_date_covering', 'movements',
+            ['client_id', sa.text('date DESC')], unique=False,
+            postgresql_include=['type', 'amount'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_movements_client_date', table_name='movements',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_movements_client_date', 'movements',
+            ['client_id', sa.text('date DESC')], unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_movements_client_date_covering', table_name='movements',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,124 @@
+import asyncio
+import pytest
+import pytest_asyncio
+import os
+import sys
+from pathlib import Path
+from sqlalchemy import event
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+# Add the root directory to Python path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Set environment variables for testing
+os.environ["TESTING"] = "1"
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///./test.db"
+
+from app.database import Base, set_sqlite_pragmas
+# Register every table on Base.metadata before the schema is created
+from app.models import user, client, asset, allocation, movement  # noqa: F401
+
+# Resolve relationships once at import instead of on the first query of the run
+configure_mappers()
+
+# In-memory database shared by the test modules that run inside a rolled-back transaction.
+# Each pytest-xdist worker is its own process, so each gets a private copy.
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+# Built once; each test binds its session to the module connection
+TestSessionLocal = async_sessionmaker(
+    expire_on_commit=False,
+    autoflush=False,
+    join_transaction_mode="create_savepoint"
+)
+
+@pytest.fixture(autouse=True)
+def setup_test_environment():
+    """Setup test environment"""
+    yield
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole run, so session-scoped async fixtures can use it"""
+    # uvloop is not available on Windows; fall back to the default asyncio loop there
+    try:
+        import uvloop
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest_asyncio.fixture(scope="session")
+async def engine():
+    """Create the test engine and schema once per test run"""
+    # StaticPool keeps the single in-memory connection (and its data) alive for the whole run.
+    # NullPool would open a new, empty database per checkout. Tests use the connection one at a
+    # time on one loop, so sharing it is safe, and pinging it would only add a round trip.
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        # Same compiled-statement cache size as the app engine, so the run keeps every hot query warm
+        query_cache_size=1200,
+        poolclass=StaticPool,
+        pool_pre_ping=False,
+        connect_args={"check_same_thread": False}
+    )
+    
+    # pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy emit BEGIN
+    @event.listens_for(engine.sync_engine, "connect")
+    def disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
+    # A fresh in-memory database is always empty, so there is nothing to drop first
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    
+    yield engine
+    
+    await engine.dispose()
+
+@pytest_asyncio.fixture(scope="module")
+async def connection(engine):
+    """One connection per test module inside a transaction that is rolled back when the module ends"""
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            yield conn
+        finally:
+            await transaction.rollback()
+
+@pytest_asyncio.fixture
+async def async_session(connection):
+    """Session whose commits only release SAVEPOINTs; everything is rolled back after the test"""
+    # Rows written straight to the module connection (seed data) sit outside this savepoint and survive it
+    savepoint = await connection.begin_nested()
+    try:
+        async with TestSessionLocal(bind=connection) as session:
+            yield session
+    finally:
+        if savepoint.is_active:
+            await savepoint.rollback()
+
+@pytest.fixture
+def sql_counter(engine):
+    """Collect the SQL statements a test runs; clear() it right before the block being measured"""
+    statements = []
+    
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        # SAVEPOINTs come from the test session's transaction wrapper, not the code under test
+        if "SAVEPOINT" not in statement:
+            statements.append(statement)
+    
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
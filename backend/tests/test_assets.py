@@ -0,0 +1,302 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from unittest.mock import AsyncMock
+from decimal import Decimal
+from sqlalchemy import insert
+
+from app.models.asset import Asset
+from app.schemas.asset import AssetCreate, AssetUpdate, YahooFinanceResponse
+from app.services.asset import (
+    get_assets, get_asset, get_asset_by_ticker, create_asset,
+    create_asset_from_ticker, update_asset, delete_asset, search_assets_by_ticker
+)
+
+async def _make_asset(session: AsyncSession, **fields) -> Asset:
+    """Insert one asset with INSERT ... RETURNING and return it"""
+    result = await session.execute(insert(Asset).values(**fields).returning(Asset))
+    return result.scalar_one()
+
+@pytest_asyncio.fixture(scope="class")
+async def seeded_assets(connection: AsyncConnection) -> dict[str, int]:
+    """Seed the read-only assets once per class and map each ticker to its id"""
+    # The class SAVEPOINT sits under every test's own, so the rows are gone once the class finishes
+    savepoint = await connection.begin_nested()
+    try:
+        result = await connection.execute(insert(Asset).returning(Asset.ticker, Asset.id), [
+            {"ticker": "AAPL", "name": "Apple Inc.", "exchange": "NASDAQ", "currency": "USD"},
+            {"ticker": "GOOGL", "name": "Alphabet Inc.", "exchange": "NASDAQ", "currency": "USD"},
+            {"ticker": "MSFT", "name": "Microsoft Corp.", "exchange": "NASDAQ", "currency": "USD"},
+            {"ticker": "APLE", "name": "Apple Hospitality REIT", "exchange": "NYSE", "currency": "USD"},
+        ])
+        yield dict(result.all())
+    finally:
+        await savepoint.rollback()
+
+@pytest.mark.usefixtures("seeded_assets")
+class TestAssetReads:
+    """Tests that only read assets and share one seeded set"""
+
+    async def test_get_assets(self, async_session: AsyncSession):
+        """Test retrieving all assets with pagination"""
+        assets = await get_assets(async_session, skip=1, limit=2)
+        
+        assert len(assets) == 2
+        assert all(isinstance(asset, Asset) for asset in assets)
+
+    async def test_get_asset(self, async_session: AsyncSession, seeded_assets: dict):
+        """Test retrieving a specific asset by ID"""
+        asset_id = seeded_assets["AAPL"]
+        
+        retrieved_asset = await get_asset(async_session, asset_id)
+        
+        assert retrieved_asset is not None
+        assert retrieved_asset.id == asset_id
+        assert retrieved_asset.ticker == "AAPL"
+        assert retrieved_asset.name == "Apple Inc."
+
+    async def test_get_asset_not_found(self, async_session: AsyncSession):
+        """Test retrieving a non-existent asset"""
+        retrieved_asset = await get_asset(async_session, 99999)
+        assert retrieved_asset is None
+
+    async def test_get_asset_by_ticker(self, async_session: AsyncSession):
+        """Test retrieving an asset by ticker"""
+        retrieved_asset = await get_asset_by_ticker(async_session, "AAPL")
+        
+        assert retrieved_asset is not None
+        assert retrieved_asset.ticker == "AAPL"
+        assert retrieved_asset.name == "Apple Inc."
+
+    async def test_get_asset_by_ticker_case_insensitive(self, async_session: AsyncSession):
+        """Test retrieving asset by ticker with case insensitivity"""
+        retrieved_asset = await get_asset_by_ticker(async_session, "aapl")
+        
+        assert retrieved_asset is not None
+        assert retrieved_asset.ticker == "AAPL"
+
+    async def test_get_asset_by_ticker_not_found(self, async_session: AsyncSession):
+        """Test retrieving a non-existent asset by ticker"""
+        retrieved_asset = await get_asset_by_ticker(async_session, "NONEXISTENT")
+        assert retrieved_asset is None
+
+    async def test_search_assets_by_ticker(self, async_session: AsyncSession):
+        """Test searching assets by ticker (partial match)"""
+        results = await search_assets_by_ticker(async_session, "AAP")
+        
+        assert len(results) == 1
+        assert any(asset.ticker == "AAPL" for asset in results)
+
+    async def test_search_assets_by_ticker_case_insensitive(self, async_session: AsyncSession):
+        """Test searching assets by ticker with case insensitivity"""
+        results = await search_assets_by_ticker(async_session, "aapl")
+        
+        assert len(results) == 1
+        assert results[0].ticker == "AAPL"
+
+    async def test_search_assets_by_ticker_no_match(self, async_session: AsyncSession):
+        """Test searching assets by ticker with no matches"""
+        results = await search_assets_by_ticker(async_session, "XYZ")
+        
+        assert len(results) == 0
+
+    async def test_search_assets_by_ticker_exact_match(self, async_session: AsyncSession):
+        """Test searching assets by ticker with exact match"""
+        results = await search_assets_by_ticker(async_session, "AAPL")
+        
+        assert len(results) == 1
+        assert results[0].ticker == "AAPL"
+
+    async def test_search_assets_by_ticker_prefix_only(self, async_session: AsyncSession):
+        """Test that ticker search matches prefixes, not substrings"""
+        results = await search_assets_by_ticker(async_session, "APL")
+        
+        assert [asset.ticker for asset in results] == ["APLE"]
+
+async def test_create_asset(async_session: AsyncSession):
+    """Test creating a new asset"""
+    asset_data = AssetCreate(
+        ticker="TSLA",
+        name="Tesla Inc.",
+        exchange="NASDAQ",
+        currency="USD"
+    )
+    
+    # Test create_asset
+    created_asset = await create_asset(async_session, asset_data)
+    
+    assert created_asset is not None
+    assert created_asset.id is not None
+    assert created_asset.ticker == "TSLA"
+    assert created_asset.name == "Tesla Inc."
+    assert created_asset.exchange == "NASDAQ"
+    assert created_asset.currency == "USD"
+
+async def test_create_asset_duplicate_ticker(async_session: AsyncSession):
+    """Test creating an asset with duplicate ticker"""
+    # Create initial asset
+    asset1_data = AssetCreate(
+        ticker="AAPL",
+        name="Apple Inc.",
+        exchange="NASDAQ",
+        currency="USD"
+    )
+    await create_asset(async_session, asset1_data)
+    
+    # Try to create duplicate
+    asset2_data = AssetCreate(
+        ticker="AAPL",
+        name="Apple Company",  # Different name
+        exchange="NYSE",       # Different exchange
+        currency="EUR"         # Different currency
+    )
+    duplicate_asset = await create_asset(async_session, asset2_data)
+    
+    # Should return existing asset, not create new one
+    assert duplicate_asset is not None
+    assert duplicate_asset.name == "Apple Inc."  # Original name
+    assert duplicate_asset.exchange == "NASDAQ"  # Original exchange
+
+async def test_create_asset_normalizes_ticker(async_session: AsyncSession):
+    """Test that created tickers are stored uppercase and deduplicated case-insensitively"""
+    asset_data = AssetCreate(ticker="msft", name="Microsoft", exchange="NASDAQ", currency="USD")
+    created_asset = await create_asset(async_session, asset_data)
+    
+    duplicate_data = AssetCreate(ticker="MSFT", name="Microsoft Corp", exchange="NASDAQ", currency="USD")
+    duplicate_asset = await create_asset(async_session, duplicate_data)
+    
+    assert created_asset.ticker == "MSFT"
+    assert duplicate_asset.id == created_asset.id
+    assert duplicate_asset.name == "Microsoft"
+
+async def test_create_asset_from_ticker_success(async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch):
+    """Test creating asset from Yahoo Finance ticker successfully"""
+    mock_asset_data = YahooFinanceResponse(ticker="AAPL", name="Apple Inc.", exchange="NASDAQ", currency="USD")
+    
+    async def fake_fetch(ticker):
+        return mock_asset_data
+    
+    monkeypatch.setattr("app.services.asset.fetch_asset_data", fake_fetch)
+    
+    # Test create_asset_from_ticker
+    created_asset = await create_asset_from_ticker(async_session, "AAPL")
+    
+    assert created_asset is not None
+    assert created_asset.ticker == "AAPL"
+    assert created_asset.name == "Apple Inc."
+    assert created_asset.exchange == "NASDAQ"
+    assert created_asset.currency == "USD"
+
+async def test_create_asset_from_ticker_already_exists(async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch):
+    """Test creating asset from ticker when asset already exists"""
+    # Create existing asset
+    existing_asset = await _make_asset(
+        async_session,
+        ticker="AAPL",
+        name="Apple Inc.",
+        exchange="NASDAQ",
+        currency="USD"
+    )
+    
+    # Mock Yahoo Finance data (should not be called)
+    mock_fetch = AsyncMock()
+    monkeypatch.setattr("app.services.asset.fetch_asset_data", mock_fetch)
+    
+    # Test create_asset_from_ticker
+    result_asset = await create_asset_from_ticker(async_session, "AAPL")
+    
+    # Should return existing asset without calling Yahoo Finance
+    mock_fetch.assert_not_called()
+    assert result_asset is not None
+    assert result_asset.id == existing_asset.id
+    assert result_asset.ticker == "AAPL"
+
+async def test_create_asset_from_ticker_yahoo_failure(async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch):
+    """Test creating asset from ticker when Yahoo Finance fails"""
+    async def failed_fetch(ticker):
+        return None
+    
+    monkeypatch.setattr("app.services.asset.fetch_asset_data", failed_fetch)
+    
+    # Test create_asset_from_ticker with Yahoo Finance failure
+    result_asset = await create_asset_from_ticker(async_session, "INVALIDTICKER")
+    
+    assert result_asset is None
+
+async def test_update_asset(async_session: AsyncSession):
+    """Test updating an asset"""
+    # Create test asset
+    asset = await _make_asset(
+        async_session,
+        ticker="AAPL",
+        name="Apple Inc.",
+        exchange="NASDAQ",
+        currency="USD"
+    )
+    
+    # Test update_asset
+    update_data = AssetUpdate(
+        name="Apple Company",
+        exchange="NYSE",
+        current_price=Decimal('150.75')
+    )
+    updated_asset = await update_asset(async_session, asset.id, update_data)
+    
+    assert updated_asset is not None
+    assert updated_asset.name == "Apple Company"
+    assert updated_asset.exchange == "NYSE"
+    assert updated_asset.ticker == "AAPL"  # Should remain unchanged
+
+async def test_update_asset_partial(async_session: AsyncSession):
+    """Test partial update of an asset"""
+    # Create test asset
+    asset = await _make_asset(
+        async_session,
+        ticker="AAPL",
+        name="Apple Inc.",
+        exchange="NASDAQ",
+        currency="USD"
+    )
+    
+    # Test partial update (only name)
+    update_data = AssetUpdate(name="Apple Corporation")
+    updated_asset = await update_asset(async_session, asset.id, update_data)
+    
+    assert updated_asset is not None
+    assert updated_asset.name == "Apple Corporation"
+    assert updated_asset.exchange == "NASDAQ"  # Should remain unchanged
+    assert updated_asset.currency == "USD"     # Should remain unchanged
+
+async def test_update_asset_not_found(async_session: AsyncSession):
+    """Test updating a non-existent asset"""
+    update_data = AssetUpdate(name="Non-existent Asset")
+    updated_asset = await update_asset(async_session, 99999, update_data)
+    assert updated_asset is None
+
+async def test_delete_asset(async_session: AsyncSession):
+    """Test deleting an asset"""
+    # Create test asset
+    asset = await _make_asset(
+        async_session,
+        ticker="AAPL",
+        name="Apple Inc.",
+        exchange="NASDAQ",
+        currency="USD"
+    )
+    
+    # Verify asset exists
+    asset_before = await get_asset(async_session, asset.id)
+    assert asset_before is not None
+    
+    # Test delete_asset
+    deleted_asset = await delete_asset(async_session, asset.id)
+    assert deleted_asset is not None
+    
+    # Verify asset no longer exists
+    asset_after = await get_asset(async_session, asset.id)
+    assert asset_after is None
+
+async def test_delete_asset_not_found(async_session: AsyncSession):
+    """Test deleting a non-existent asset"""
+    deleted_asset = await delete_asset(async_session, 99999)
+    assert deleted_asset is None
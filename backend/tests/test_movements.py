@@ -1,7 +1,6 @@
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 from datetime import datetime, timedelta
 from decimal import Decimal
 
@@ -9,51 +8,53 @@ from app.models.movement import Movement, MovementType
 from app.models.client import Client
 from app.schemas.movement import MovementCreate, MovementUpdate, PeriodFilter
 from app.services.movement import (
-    export_client_movements_csv, get_movements, get_movement, create_movement, update_movement,
+    stream_client_movements_csv, get_movements, get_movement, create_movement, update_movement,
     delete_movement, get_client_movements, get_movements_by_period,
     get_movement_summary, get_office_summary, get_client_balance
 )
-from app.database import Base
+from sqlalchemy import insert
+from sqlalchemy.exc import InvalidRequestError
 import csv
 import io
 
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# Amounts shared by the seeding lists, parsed once at import
+ONE_HUNDRED = Decimal('100.00')
+TWO_HUNDRED = Decimal('200.00')
+THREE_HUNDRED = Decimal('300.00')
+FIVE_HUNDRED = Decimal('500.00')
+SEVEN_FIFTY = Decimal('750.00')
+ONE_THOUSAND = Decimal('1000.00')
+TWO_THOUSAND = Decimal('2000.00')
+THREE_THOUSAND = Decimal('3000.00')
 
-@pytest_asyncio.fixture
-async def async_session():
-    """Create test database session"""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-    
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
-    
-    async_session_maker = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
+@pytest_asyncio.fixture(scope="module")
+async def client_ids(connection: AsyncConnection) -> list[int]:
+    """Seed two clients once for the module and return their ids"""
+    result = await connection.execute(
+        insert(Client).returning(Client.id, sort_by_parameter_order=True),
+        [
+            {"name": "Client One", "email": "client1@example.com"},
+            {"name": "Client Two", "email": "client2@example.com"},
+        ]
     )
-    
-    async with async_session_maker() as session:
-        # Create test clients
-        client1 = Client(name="Client One", email="client1@example.com")
-        client2 = Client(name="Client Two", email="client2@example.com")
-        session.add_all([client1, client2])
-        await session.commit()
-        await session.refresh(client1)
-        await session.refresh(client2)
-        
-        yield session
-    
-    await engine.dispose()
+    return result.scalars().all()
+
+def _movement(client_id: int, type: MovementType, amount: Decimal, date: datetime) -> MovementCreate:
+    """Build a MovementCreate from the four fields the seeding lists vary"""
+    return MovementCreate(client_id=client_id, type=type, amount=amount, date=date)
+
+async def _create_movements(session: AsyncSession, movements_data: list[MovementCreate]):
+    """Insert every movement with one executemany INSERT and a single commit"""
+    await session.execute(insert(Movement), [movement.model_dump() for movement in movements_data])
+    await session.commit()
 
-@pytest.mark.asyncio
-async def test_create_movement(async_session: AsyncSession):
+async def test_create_movement(async_session: AsyncSession, client_ids: list):
     """Test creating a new movement"""
     # Get test client
-    result = await async_session.execute(Client.__table__.select())
-    client = result.first()
+    client_id = client_ids[0]
     
     movement_data = MovementCreate(
-        client_id=client[0],
+        client_id=client_id,
         type=MovementType.deposit,
         amount=Decimal('1500.50'),
         date=datetime.utcnow(),
@@ -66,22 +67,15 @@ async def test_create_movement(async_session: AsyncSession):
     assert created_movement.id is not None
     assert created_movement.type == MovementType.deposit
     assert created_movement.amount == Decimal('1500.50')
-    assert created_movement.client_id == client[0]
+    assert created_movement.client_id == client_id
     assert created_movement.note == "Initial deposit"
 
-@pytest.mark.asyncio
-async def test_get_movement(async_session: AsyncSession):
+async def test_get_movement(async_session: AsyncSession, client_ids: list):
     """Test retrieving a movement by ID"""
     # Get test client and create movement
-    result = await async_session.execute(Client.__table__.select())
-    client = result.first()
+    client_id = client_ids[0]
     
-    movement_data = MovementCreate(
-        client_id=client[0],
-        type=MovementType.deposit,
-        amount=Decimal('1000.00'),
-        date=datetime.utcnow()
-    )
+    movement_data = _movement(client_id, MovementType.deposit, ONE_THOUSAND, datetime.utcnow())
     created_movement = await create_movement(async_session, movement_data)
     
     # Retrieve the movement
@@ -90,44 +84,40 @@ async def test_get_movement(async_session: AsyncSession):
     assert retrieved_movement is not None
     assert retrieved_movement.id == created_movement.id
     assert retrieved_movement.amount == Decimal('1000.00')
-    assert retrieved_movement.client_id == client[0]
+    assert retrieved_movement.client_id == client_id
 
-@pytest.mark.asyncio
-async def test_get_movement_not_found(async_session: AsyncSession):
-    """Test retrieving a non-existent movement"""
-    retrieved_movement = await get_movement(async_session, 99999)
-    assert retrieved_movement is None
+@pytest.mark.parametrize("operation", [
+    get_movement,
+    lambda db, movement_id: update_movement(db, movement_id, MovementUpdate(amount=ONE_THOUSAND)),
+    delete_movement,
+], ids=["get", "update", "delete"])
+async def test_movement_not_found(async_session: AsyncSession, operation):
+    """Test that get, update and delete return None for a non-existent movement"""
+    assert await operation(async_session, 99999) is None
 
-@pytest.mark.asyncio
-async def test_get_movements_with_pagination(async_session: AsyncSession):
+async def test_get_movements_with_pagination(async_session: AsyncSession, client_ids: list):
     """Test retrieving movements with pagination"""
     # Get test client
-    result = await async_session.execute(Client.__table__.select())
-    client = result.first()
+    client_id = client_ids[0]
     
     # Create multiple movements
-    for i in range(5):
-        movement_data = MovementCreate(
-            client_id=client[0],
-            type=MovementType.deposit,
-            amount=Decimal(f'{1000 + i}.00'),
-            date=datetime.utcnow()
-        )
-        await create_movement(async_session, movement_data)
+    now = datetime.utcnow()
+    await _create_movements(async_session, [
+        _movement(client_id, MovementType.deposit, ONE_THOUSAND + i, now)
+        for i in range(5)
+    ])
     
     # Test pagination
     movements = await get_movements(async_session, skip=2, limit=2)
     assert len(movements) == 2
 
-@pytest.mark.asyncio
-async def test_update_movement(async_session: AsyncSession):
+async def test_update_movement(async_session: AsyncSession, client_ids: list):
     """Test updating a movement"""
     # Get test client and create movement
-    result = await async_session.execute(Client.__table__.select())
-    client = result.first()
+    client_id = client_ids[0]
     
     movement_data = MovementCreate(
-        client_id=client[0],
+        client_id=client_id,
         type=MovementType.deposit,
         amount=Decimal('500.00'),
         date=datetime.utcnow(),
@@ -147,15 +137,13 @@ async def test_update_movement(async_session: AsyncSession):
     assert updated_movement.note == "Updated note"
     assert updated_movement.type == MovementType.deposit  # Should remain unchanged
 
-@pytest.mark.asyncio
-async def test_update_movement_partial(async_session: AsyncSession):
+async def test_update_movement_partial(async_session: AsyncSession, client_ids: list):
     """Test partial update of a movement"""
     # Get test client and create movement
-    result = await async_session.execute(Client.__table__.select())
-    client = result.first()
+    client_id = client_ids[0]
     
     movement_data = MovementCreate(
-        client_id=client[0],
+        client_id=client_id,
         type=MovementType.deposit,
         amount=Decimal('500.00'),
         date=datetime.utcnow(),
@@ -171,26 +159,12 @@ async def test_update_movement_partial(async_session: AsyncSession):
     assert updated_movement.amount == Decimal('600.00')
     assert updated_movement.note == "Original note"  # Should remain unchanged
 
-@pytest.mark.asyncio
-async def test_update_movement_not_found(async_session: AsyncSession):
-    """Test updating a non-existent movement"""
-    update_data = MovementUpdate(amount=Decimal('1000.00'))
-    updated_movement = await update_movement(async_session, 99999, update_data)
-    assert updated_movement is None
-
-@pytest.mark.asyncio
-async def test_delete_movement(async_session: AsyncSession):
+async def test_delete_movement(async_session: AsyncSession, client_ids: list):
     """Test deleting a movement"""
     # Get test client and create movement
-    result = await async_session.execute(Client.__table__.select())
-    client = result.first()
+    client_id = client_ids[0]
     
-    movement_data = MovementCreate(
-        client_id=client[0],
-        type=MovementType.deposit,
-        amount=Decimal('1000.00'),
-        date=datetime.utcnow()
-    )
+    movement_data = _movement(client_id, MovementType.deposit, ONE_THOUSAND, datetime.utcnow())
     created_movement = await create_movement(async_session, movement_data)
     
     # Verify movement exists
@@ -205,64 +179,37 @@ async def test_delete_movement(async_session: AsyncSession):
     movement_after = await get_movement(async_session, created_movement.id)
     assert movement_after is None
 
-@pytest.mark.asyncio
-async def test_delete_movement_not_found(async_session: AsyncSession):
-    """Test deleting a non-existent movement"""
-    deleted_movement = await delete_movement(async_session, 99999)
-    assert deleted_movement is None
-
-@pytest.mark.asyncio
-async def test_get_client_movements(async_session: AsyncSession):
+async def test_get_client_movements(async_session: AsyncSession, client_ids: list):
     """Test retrieving movements for a specific client"""
     # Get test clients
-    result = await async_session.execute(Client.__table__.select())
-    clients = result.all()
-    client1_id = clients[0][0]
-    client2_id = clients[1][0]
+    client1_id, client2_id = client_ids
     
     # Create movements for both clients
-    for client_id in [client1_id, client1_id, client2_id]:
-        movement_data = MovementCreate(
-            client_id=client_id,
-            type=MovementType.deposit,
-            amount=Decimal('500.00'),
-            date=datetime.utcnow()
-        )
-        await create_movement(async_session, movement_data)
+    now = datetime.utcnow()
+    await _create_movements(async_session, [
+        _movement(client_id, MovementType.deposit, FIVE_HUNDRED, now)
+        for client_id in [client1_id, client1_id, client2_id]
+    ])
     
     # Get movements for client1 only
     client1_movements = await get_client_movements(async_session, client1_id)
     assert len(client1_movements) == 2
     assert all(m.client_id == client1_id for m in client1_movements)
 
-@pytest.mark.asyncio
-async def test_get_client_movements_with_period_filter(async_session: AsyncSession):
+async def test_get_client_movements_with_period_filter(async_session: AsyncSession, client_ids: list):
     """Test retrieving client movements with date filter"""
     # Get test client
-    result = await async_session.execute(Client.__table__.select())
-    client = result.first()
-    client_id = client[0]
+    client_id = client_ids[0]
     
     now = datetime.utcnow()
     yesterday = now - timedelta(days=1)
     tomorrow = now + timedelta(days=1)
     
     # Create movements with different dates
-    movement1 = MovementCreate(
-        client_id=client_id,
-        type=MovementType.deposit,
-        amount=Decimal('1000.00'),
-        date=yesterday
-    )
-    movement2 = MovementCreate(
-        client_id=client_id,
-        type=MovementType.deposit,
-        amount=Decimal('500.00'),
-        date=tomorrow
-    )
+    movement1 = _movement(client_id, MovementType.deposit, ONE_THOUSAND, yesterday)
+    movement2 = _movement(client_id, MovementType.deposit, FIVE_HUNDRED, tomorrow)
     
-    await create_movement(async_session, movement1)
-    await create_movement(async_session, movement2)
+    await _create_movements(async_session, [movement1, movement2])
     
     # Filter by period (only yesterday)
     period_filter = PeriodFilter(
@@ -274,14 +221,10 @@ async def test_get_client_movements_with_period_filter(async_session: AsyncSessi
     assert len(movements) == 1
     assert movements[0].amount == Decimal('1000.00')
 
-@pytest.mark.asyncio
-async def test_get_movements_by_period(async_session: AsyncSession):
+async def test_get_movements_by_period(async_session: AsyncSession, client_ids: list):
     """Test retrieving movements filtered by period"""
     # Get test clients
-    result = await async_session.execute(Client.__table__.select())
-    clients = result.all()
-    client1_id = clients[0][0]
-    client2_id = clients[1][0]
+    client1_id, client2_id = client_ids
     
     now = datetime.utcnow()
     last_week = now - timedelta(days=7)
@@ -289,13 +232,12 @@ async def test_get_movements_by_period(async_session: AsyncSession):
     
     # Create movements with different dates
     movements_data = [
-        MovementCreate(client_id=client1_id, type=MovementType.deposit, amount=Decimal('1000.00'), date=last_week),
-        MovementCreate(client_id=client2_id, type=MovementType.withdrawal, amount=Decimal('500.00'), date=now),
-        MovementCreate(client_id=client1_id, type=MovementType.deposit, amount=Decimal('750.00'), date=next_week),
+        _movement(client1_id, MovementType.deposit, ONE_THOUSAND, last_week),
+        _movement(client2_id, MovementType.withdrawal, FIVE_HUNDRED, now),
+        _movement(client1_id, MovementType.deposit, SEVEN_FIFTY, next_week),
     ]
     
-    for movement_data in movements_data:
-        await create_movement(async_session, movement_data)
+    await _create_movements(async_session, movements_data)
     
     # Filter by period (last week to now)
     period_filter = PeriodFilter(
@@ -306,24 +248,17 @@ async def test_get_movements_by_period(async_session: AsyncSession):
     
     assert len(movements) == 2  # Only movements from last_week to now
 
-@pytest.mark.asyncio
-async def test_get_movements_by_period_with_client_filter(async_session: AsyncSession):
+async def test_get_movements_by_period_with_client_filter(async_session: AsyncSession, client_ids: list):
     """Test retrieving movements filtered by period and client"""
     # Get test clients
-    result = await async_session.execute(Client.__table__.select())
-    clients = result.all()
-    client1_id = clients[0][0]
-    client2_id = clients[1][0]
+    client1_id, client2_id = client_ids
     
     # Create movements for both clients
-    for client_id in [client1_id, client1_id, client2_id]:
-        movement_data = MovementCreate(
-            client_id=client_id,
-            type=MovementType.deposit,
-            amount=Decimal('500.00'),
-            date=datetime.utcnow()
-        )
-        await create_movement(async_session, movement_data)
+    now = datetime.utcnow()
+    await _create_movements(async_session, [
+        _movement(client_id, MovementType.deposit, FIVE_HUNDRED, now)
+        for client_id in [client1_id, client1_id, client2_id]
+    ])
     
     # Filter by client1 only
     period_filter = PeriodFilter(client_id=client1_id)
@@ -332,24 +267,50 @@ async def test_get_movements_by_period_with_client_filter(async_session: AsyncSe
     assert len(movements) == 2
     assert all(m.client_id == client1_id for m in movements)
 
-@pytest.mark.asyncio
-async def test_get_movement_summary(async_session: AsyncSession):
+async def test_get_movements_by_period_query_count(async_session: AsyncSession, client_ids: list, sql_counter: list):
+    """Test that movements and their clients load in a single statement"""
+    now = datetime.utcnow()
+    await _create_movements(async_session, [
+        _movement(client_id, MovementType.deposit, ONE_HUNDRED, now)
+        for client_id in client_ids
+    ])
+    async_session.expunge_all()
+    
+    sql_counter.clear()
+    movements = await get_movements_by_period(async_session, PeriodFilter())
+    client_names = {m.client.name for m in movements}
+    
+    assert client_names == {"Client One", "Client Two"}
+    assert len(sql_counter) == 1
+
+async def test_get_client_movements_does_not_lazy_load(async_session: AsyncSession, client_ids: list):
+    """Test that touching an unloaded relationship raises instead of querying"""
+    client_id = client_ids[0]
+    
+    await create_movement(async_session, _movement(client_id, MovementType.deposit, ONE_HUNDRED, datetime.utcnow()))
+    async_session.expunge_all()
+    
+    movements = await get_client_movements(async_session, client_id)
+    
+    assert len(movements) == 1
+    with pytest.raises(InvalidRequestError):
+        movements[0].client
+
+async def test_get_movement_summary(async_session: AsyncSession, client_ids: list):
     """Test movement summary calculation"""
     # Get test client
-    result = await async_session.execute(Client.__table__.select())
-    client = result.first()
-    client_id = client[0]
+    client_id = client_ids[0]
     
     # Create test movements
+    now = datetime.utcnow()
     movements_data = [
-        MovementCreate(client_id=client_id, type=MovementType.deposit, amount=Decimal('2000.00'), date=datetime.utcnow()),
-        MovementCreate(client_id=client_id, type=MovementType.deposit, amount=Decimal('1000.00'), date=datetime.utcnow()),
-        MovementCreate(client_id=client_id, type=MovementType.withdrawal, amount=Decimal('500.00'), date=datetime.utcnow()),
-        MovementCreate(client_id=client_id, type=MovementType.withdrawal, amount=Decimal('300.00'), date=datetime.utcnow()),
+        _movement(client_id, MovementType.deposit, TWO_THOUSAND, now),
+        _movement(client_id, MovementType.deposit, ONE_THOUSAND, now),
+        _movement(client_id, MovementType.withdrawal, FIVE_HUNDRED, now),
+        _movement(client_id, MovementType.withdrawal, THREE_HUNDRED, now),
     ]
     
-    for movement_data in movements_data:
-        await create_movement(async_session, movement_data)
+    await _create_movements(async_session, movements_data)
     
     # Get summary
     summary = await get_movement_summary(async_session, PeriodFilter(client_id=client_id))
@@ -359,7 +320,6 @@ async def test_get_movement_summary(async_session: AsyncSession):
     assert summary.net_flow == Decimal('2200.00')
     assert summary.movement_count == 4
 
-@pytest.mark.asyncio
 async def test_get_movement_summary_empty(async_session: AsyncSession):
     """Test movement summary with no movements"""
     summary = await get_movement_summary(async_session)
@@ -369,25 +329,21 @@ async def test_get_movement_summary_empty(async_session: AsyncSession):
     assert summary.net_flow == Decimal('0')
     assert summary.movement_count == 0
 
-@pytest.mark.asyncio
-async def test_get_office_summary(async_session: AsyncSession):
+async def test_get_office_summary(async_session: AsyncSession, client_ids: list):
     """Test office-wide summary with client breakdown"""
     # Get test clients
-    result = await async_session.execute(Client.__table__.select())
-    clients = result.all()
-    client1_id = clients[0][0]
-    client2_id = clients[1][0]
+    client1_id, client2_id = client_ids
     
     # Create movements for both clients
+    now = datetime.utcnow()
     movements_data = [
-        MovementCreate(client_id=client1_id, type=MovementType.deposit, amount=Decimal('2000.00'), date=datetime.utcnow()),
-        MovementCreate(client_id=client1_id, type=MovementType.withdrawal, amount=Decimal('500.00'), date=datetime.utcnow()),
-        MovementCreate(client_id=client2_id, type=MovementType.deposit, amount=Decimal('1000.00'), date=datetime.utcnow()),
-        MovementCreate(client_id=client2_id, type=MovementType.withdrawal, amount=Decimal('200.00'), date=datetime.utcnow()),
+        _movement(client1_id, MovementType.deposit, TWO_THOUSAND, now),
+        _movement(client1_id, MovementType.withdrawal, FIVE_HUNDRED, now),
+        _movement(client2_id, MovementType.deposit, ONE_THOUSAND, now),
+        _movement(client2_id, MovementType.withdrawal, TWO_HUNDRED, now),
     ]
     
-    for movement_data in movements_data:
-        await create_movement(async_session, movement_data)
+    await _create_movements(async_session, movements_data)
     
     # Get office summary
     office_summary = await get_office_summary(async_session)
@@ -406,36 +362,78 @@ async def test_get_office_summary(async_session: AsyncSession):
     assert client1_summary.total_deposits == Decimal('2000.00')
     assert client1_summary.total_withdrawals == Decimal('500.00')
 
-@pytest.mark.asyncio
-async def test_get_client_balance(async_session: AsyncSession):
+async def test_get_office_summary_with_client_filter(async_session: AsyncSession, client_ids: list):
+    """Test a client filter narrows the office totals but keeps every client's breakdown"""
+    client1_id, client2_id = client_ids
+    
+    now = datetime.utcnow()
+    movements_data = [
+        _movement(client1_id, MovementType.deposit, TWO_THOUSAND, now),
+        _movement(client2_id, MovementType.deposit, ONE_THOUSAND, now),
+    ]
+    
+    await _create_movements(async_session, movements_data)
+    
+    office_summary = await get_office_summary(async_session, PeriodFilter(client_id=client1_id))
+    
+    assert office_summary.total_deposits == Decimal('2000.00')
+    assert office_summary.total_movements == 1
+    
+    assert set(office_summary.client_summaries) == {client1_id, client2_id}
+    assert office_summary.client_summaries[client2_id]['summary'].total_deposits == Decimal('1000.00')
+
+async def test_get_office_summary_with_period_filter(async_session: AsyncSession, client_ids: list):
+    """Test office summary keeps clients without movements in the period"""
+    client1_id, client2_id = client_ids
+    
+    now = datetime.utcnow()
+    last_week = now - timedelta(days=7)
+    
+    movements_data = [
+        _movement(client1_id, MovementType.deposit, TWO_THOUSAND, now),
+        _movement(client1_id, MovementType.withdrawal, FIVE_HUNDRED, now),
+        _movement(client2_id, MovementType.deposit, ONE_THOUSAND, last_week),
+    ]
+    
+    await _create_movements(async_session, movements_data)
+    
+    period_filter = PeriodFilter(start_date=now - timedelta(days=1))
+    office_summary = await get_office_summary(async_session, period_filter)
+    
+    assert office_summary.total_deposits == Decimal('2000.00')
+    assert office_summary.total_withdrawals == Decimal('500.00')
+    assert office_summary.net_flow == Decimal('1500.00')
+    assert office_summary.total_movements == 2
+    
+    client2_summary = office_summary.client_summaries[client2_id]['summary']
+    assert client2_summary.total_deposits == Decimal('0')
+    assert client2_summary.movement_count == 0
+    assert office_summary.client_summaries[client1_id]['client_name'] == "Client One"
+
+async def test_get_client_balance(async_session: AsyncSession, client_ids: list):
     """Test client balance calculation"""
     # Get test client
-    result = await async_session.execute(Client.__table__.select())
-    client = result.first()
-    client_id = client[0]
+    client_id = client_ids[0]
     
     # Create test movements
+    now = datetime.utcnow()
     movements_data = [
-        MovementCreate(client_id=client_id, type=MovementType.deposit, amount=Decimal('3000.00'), date=datetime.utcnow()),
-        MovementCreate(client_id=client_id, type=MovementType.withdrawal, amount=Decimal('1000.00'), date=datetime.utcnow()),
-        MovementCreate(client_id=client_id, type=MovementType.withdrawal, amount=Decimal('500.00'), date=datetime.utcnow()),
+        _movement(client_id, MovementType.deposit, THREE_THOUSAND, now),
+        _movement(client_id, MovementType.withdrawal, ONE_THOUSAND, now),
+        _movement(client_id, MovementType.withdrawal, FIVE_HUNDRED, now),
     ]
     
-    for movement_data in movements_data:
-        await create_movement(async_session, movement_data)
+    await _create_movements(async_session, movements_data)
     
     # Get balance
     balance = await get_client_balance(async_session, client_id)
     
     assert balance == Decimal('1500.00')  # 3000 - 1000 - 500
 
-@pytest.mark.asyncio
-async def test_get_client_balance_with_date_filter(async_session: AsyncSession):
+async def test_get_client_balance_with_date_filter(async_session: AsyncSession, client_ids: list):
     """Test client balance calculation with date filter"""
     # Get test client
-    result = await async_session.execute(Client.__table__.select())
-    client = result.first()
-    client_id = client[0]
+    client_id = client_ids[0]
     
     now = datetime.utcnow()
     yesterday = now - timedelta(days=1)
@@ -443,65 +441,46 @@ async def test_get_client_balance_with_date_filter(async_session: AsyncSession):
     
     # Create movements with different dates
     movements_data = [
-        MovementCreate(client_id=client_id, type=MovementType.deposit, amount=Decimal('2000.00'), date=yesterday),
-        MovementCreate(client_id=client_id, type=MovementType.withdrawal, amount=Decimal('500.00'), date=now),
-        MovementCreate(client_id=client_id, type=MovementType.deposit, amount=Decimal('1000.00'), date=tomorrow),
+        _movement(client_id, MovementType.deposit, TWO_THOUSAND, yesterday),
+        _movement(client_id, MovementType.withdrawal, FIVE_HUNDRED, now),
+        _movement(client_id, MovementType.deposit, ONE_THOUSAND, tomorrow),
     ]
     
-    for movement_data in movements_data:
-        await create_movement(async_session, movement_data)
+    await _create_movements(async_session, movements_data)
     
     # Get balance as of now (should exclude tomorrow's deposit)
     balance = await get_client_balance(async_session, client_id, now)
     
     assert balance == Decimal('1500.00')  # 2000 - 500 (excludes tomorrow's 1000)
 
-@pytest.mark.asyncio
-async def test_get_client_balance_empty(async_session: AsyncSession):
+async def test_get_client_balance_empty(async_session: AsyncSession, client_ids: list):
     """Test client balance with no movements"""
     # Get test client
-    result = await async_session.execute(Client.__table__.select())
-    client = result.first()
-    client_id = client[0]
+    client_id = client_ids[0]
     
     balance = await get_client_balance(async_session, client_id)
     assert balance == Decimal('0')
 
-@pytest.mark.asyncio
-async def test_export_client_movements_csv_basic(async_session: AsyncSession):
+async def test_export_client_movements_csv_basic(async_session: AsyncSession, client_ids: list):
     """Test basic CSV export of client movements"""
     # Get test client
-    result = await async_session.execute(Client.__table__.select())
-    client = result.first()
-    client_id = client[0]
+    client_id = client_ids[0]
     
     # Create test movements
+    now = datetime.utcnow()
     movements_data = [
-        Movement(client_id=client_id, type=MovementType.deposit, amount=Decimal('1000.00'), date=datetime.utcnow(), note="Initial deposit"),
-        Movement(client_id=client_id, type=MovementType.withdrawal, amount=Decimal('200.00'), date=datetime.utcnow(), note="Withdrawal for expenses"),
+        Movement(client_id=client_id, type=MovementType.deposit, amount=Decimal('1000.00'), date=now - timedelta(days=1), note="Initial deposit"),
+        Movement(client_id=client_id, type=MovementType.withdrawal, amount=Decimal('200.00'), date=now, note="Withdrawal for expenses"),
     ]
     
-    for movement in movements_data:
-        async_session.add(movement)
+    async_session.add_all(movements_data)
     await async_session.commit()
     
     # Test CSV export
-    csv_output = await export_client_movements_csv(async_session, client_id)
-    
-    # Verify CSV content
-    csv_content = csv_output.getvalue()
-    lines = csv_content.strip().split('\n')
-    
-    # Check header
-    assert 'ID,Date,Type,Amount,Currency,Note' in lines[0]
-    
-    # Check data rows (skip header)
-    data_rows = lines[1:]
-    assert len(data_rows) == 2
+    csv_rows = await stream_client_movements_csv(async_session, client_id)
     
     # Parse CSV rows
-    reader = csv.reader(io.StringIO(csv_content))
-    rows = list(reader)
+    rows = list(csv.reader(io.StringIO(''.join([chunk async for chunk in csv_rows]))))
     
     # Verify header
     expected_header = ['ID', 'Date', 'Type', 'Amount', 'Currency', 'Note', 'Client Name', 'Client Email', 'Created At']
@@ -509,4 +488,27 @@ async def test_export_client_movements_csv_basic(async_session: AsyncSession):
     
     # Verify data
     assert len(rows) == 3  # header + 2 data rows
-    assert rows[1][3] == '200.0'   # Amount of first movement
\ No newline at end of file
+    assert rows[1][3] == '200.0'   # Amount of first movement
+
+async def test_stream_client_movements_csv(async_session: AsyncSession, client_ids: list):
+    """Test streaming CSV export yields one chunk per batch and quotes fields"""
+    # Get test client
+    client_id = client_ids[0]
+    
+    now = datetime.utcnow()
+    movements_data = [
+        Movement(client_id=client_id, type=MovementType.deposit, amount=Decimal('1000.00'), date=now - timedelta(days=1), note="Initial deposit"),
+        Movement(client_id=client_id, type=MovementType.withdrawal, amount=Decimal('200.00'), date=now, note="Withdrawal, for expenses"),
+    ]
+    async_session.add_all(movements_data)
+    await async_session.commit()
+    
+    csv_rows = await stream_client_movements_csv(async_session, client_id)
+    chunks = [chunk async for chunk in csv_rows]
+    
+    assert len(chunks) == 2  # header + one batch of data rows
+    
+    rows = list(csv.reader(io.StringIO(''.join(chunks))))
+    assert len(rows) == 3  # header + 2 data rows
+    assert rows[1][3] == '200.0'
+    assert rows[1][5] == 'Withdrawal, for expenses'
@@ -1,38 +1,13 @@
-import pytest
-import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Import your app modules
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.services.user import delete_user, get_user_by_email, create_user, authenticate_user, get_user_by_id, get_users, update_user
-from app.database import Base
-from app.auth.jwt import verify_password
+from app.auth.jwt import create_access_token, verify_password
+from app.auth.dependencies import get_current_user
+from fastapi.security import HTTPAuthorizationCredentials
 
-# Test database URL
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
-
-@pytest_asyncio.fixture
-async def async_session():
-    """Create test database session"""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-    
-    # Create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
-    
-    async_session_maker = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-    
-    async with async_session_maker() as session:
-        yield session
-    
-    await engine.dispose()
-
-@pytest.mark.asyncio
 async def test_create_user(async_session: AsyncSession):
     """Test creating a new user with hashed password - ONE TEST FOR CREATE METHOD"""
     # Arrange
@@ -53,7 +28,6 @@ async def test_create_user(async_session: AsyncSession):
     assert created_user.password != "plainpassword"
     assert verify_password("plainpassword", created_user.password)
 
-@pytest.mark.asyncio
 async def test_get_user_by_email(async_session: AsyncSession):
     """Test retrieving a user by email"""
     # Arrange
@@ -70,10 +44,8 @@ async def test_get_user_by_email(async_session: AsyncSession):
     # Assert
     assert retrieved_user is not None
     assert retrieved_user.email == "test@example.com"
-    assert verify_password("password123", retrieved_user.password)
 
 
-@pytest.mark.asyncio
 async def test_get_user_by_id(async_session: AsyncSession):
     """Test retrieving a user by ID"""
     # Arrange
@@ -92,7 +64,6 @@ async def test_get_user_by_id(async_session: AsyncSession):
     assert retrieved_user.id == created_user.id
     assert retrieved_user.email == "test@example.com"
 
-@pytest.mark.asyncio
 async def test_get_users(async_session: AsyncSession):
     """Test retrieving all users"""
     # Arrange
@@ -110,7 +81,6 @@ async def test_get_users(async_session: AsyncSession):
     assert users[0].email == "user1@example.com"
     assert users[1].email == "user2@example.com"
 
-@pytest.mark.asyncio
 async def test_update_user(async_session: AsyncSession):
     """Test updating a user"""
     # Arrange
@@ -136,7 +106,6 @@ async def test_update_user(async_session: AsyncSession):
     assert updated_user.is_active == False
     assert verify_password("newpassword", updated_user.password)
 
-@pytest.mark.asyncio
 async def test_update_user_partial(async_session: AsyncSession):
     """Test partial user update"""
     # Arrange
@@ -146,6 +115,7 @@ async def test_update_user_partial(async_session: AsyncSession):
         is_active=True
     )
     created_user = await create_user(async_session, user_data)
+    original_hash = created_user.password
     
     # Only update email, keep other fields unchanged
     update_data = UserUpdate(email="updated@example.com")
@@ -157,9 +127,8 @@ async def test_update_user_partial(async_session: AsyncSession):
     assert updated_user is not None
     assert updated_user.email == "updated@example.com"
     assert updated_user.is_active == True  # Should remain unchanged
-    assert verify_password("originalpass", updated_user.password)  # Should remain unchanged
+    assert updated_user.password == original_hash  # Should remain unchanged
 
-@pytest.mark.asyncio
 async def test_delete_user(async_session: AsyncSession):
     """Test deleting a user"""
     # Arrange
@@ -185,7 +154,6 @@ async def test_delete_user(async_session: AsyncSession):
     user_after = await get_user_by_id(async_session, created_user.id)
     assert user_after is None
 
-@pytest.mark.asyncio
 async def test_authenticate_user_success(async_session: AsyncSession):
     """Test successful user authentication"""
     # Arrange
@@ -203,7 +171,6 @@ async def test_authenticate_user_success(async_session: AsyncSession):
     assert authenticated_user is not False
     assert authenticated_user.email == "test@example.com"
 
-@pytest.mark.asyncio
 async def test_authenticate_user_wrong_password(async_session: AsyncSession):
     """Test authentication with wrong password"""
     # Arrange
@@ -220,11 +187,26 @@ async def test_authenticate_user_wrong_password(async_session: AsyncSession):
     # Assert
     assert authenticated_user is False
 
-@pytest.mark.asyncio
 async def test_authenticate_user_not_found(async_session: AsyncSession):
     """Test authentication for non-existent user"""
     # Act
     authenticated_user = await authenticate_user(async_session, "nonexistent@example.com", "anypassword")
     
     # Assert
-    assert authenticated_user is False
\ No newline at end of file
+    assert authenticated_user is False
+async def test_get_current_user_cache_survives_rollback(async_session: AsyncSession):
+    """Test that a cached user stays readable after a failed request rolls its session back"""
+    created_user = await create_user(async_session, UserCreate(email="cached@example.com", password="password123"))
+    user_id = created_user.id
+    await async_session.commit()
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=create_access_token(data={"sub": "cached@example.com"})
+    )
+    
+    await get_current_user(credentials, async_session)
+    # get_db rolls back on errors, expiring everything the session loaded
+    await async_session.rollback()
+    
+    cached_user = await get_current_user(credentials, async_session)
+    assert cached_user.id == user_id
+    assert cached_user.email == "cached@example.com"
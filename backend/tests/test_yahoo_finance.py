@@ -0,0 +1,306 @@
+import pytest
+from unittest.mock import Mock, patch, AsyncMock
+from app.services import yahoo_finance
+from app.services.yahoo_finance import fetch_asset_data, fetch_assets_bulk, search_assets
+from app.schemas.asset import YahooFinanceResponse
+from decimal import Decimal
+import asyncio
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+# Read-only, so tests can share it without one mutating another's input
+APPLE_INFO = MappingProxyType({
+    'longName': 'Apple Inc.',
+    'exchange': 'NASDAQ',
+    'currency': 'USD',
+    'currentPrice': 150.75
+})
+
+@dataclass(slots=True)
+class MockTicker:
+    """Mock yfinance Ticker class"""
+    info: Mapping
+
+@pytest.fixture
+def mock_yf():
+    """Patch yfinance's Ticker for one test; set return_value or side_effect on it"""
+    with patch('app.services.yahoo_finance.yf.Ticker') as mock_ticker:
+        yield mock_ticker
+
+@pytest.fixture(autouse=True)
+def clear_yahoo_cache():
+    """Start every test with an empty ticker cache"""
+    yahoo_finance._cache.clear()
+    yield
+    yahoo_finance._cache.clear()
+
+async def test_fetch_asset_data_success(mock_yf):
+    """Test successfully fetching asset data from Yahoo Finance"""
+    # Mock data for a successful response
+    mock_info = {
+        'longName': 'Apple Inc.',
+        'exchange': 'NASDAQ',
+        'currency': 'USD',
+        'currentPrice': 150.75,
+        'regularMarketPrice': 150.50
+    }
+    
+    mock_yf.return_value = MockTicker(mock_info)
+    
+    # Test fetch_asset_data
+    result = await fetch_asset_data('AAPL')
+    
+    assert result is not None
+    assert isinstance(result, YahooFinanceResponse)
+    assert result.ticker == 'AAPL'
+    assert result.name == 'Apple Inc.'
+    assert result.exchange == 'NASDAQ'
+    assert result.currency == 'USD'
+    assert result.current_price == Decimal('150.75')
+
+@pytest.mark.parametrize("mock_info,expected", [
+    (
+        {'longName': 'Apple Inc.', 'exchange': 'NASDAQ', 'currency': 'USD', 'regularMarketPrice': 148.25},
+        {'current_price': Decimal('148.25')},
+    ),
+    (
+        {'exchange': 'NASDAQ', 'currency': 'USD', 'currentPrice': 150.75},
+        {'name': 'AAPL', 'exchange': 'NASDAQ'},
+    ),
+    (
+        {'longName': 'Apple Inc.', 'currency': 'USD', 'currentPrice': 150.75},
+        {'exchange': 'Unknown', 'currency': 'USD'},
+    ),
+    (
+        {'longName': 'Apple Inc.', 'exchange': 'NASDAQ', 'currentPrice': 150.75},
+        {'currency': 'USD', 'exchange': 'NASDAQ'},
+    ),
+    (
+        {'longName': 'Apple Inc.', 'exchange': 'NASDAQ', 'currency': 'USD'},
+        {'current_price': None, 'name': 'Apple Inc.'},
+    ),
+    (
+        {},
+        {'ticker': 'AAPL', 'name': 'AAPL', 'exchange': 'Unknown', 'currency': 'USD', 'current_price': None},
+    ),
+], ids=["regular_market_price", "ticker_name", "default_exchange", "default_currency", "no_price", "empty_info"])
+async def test_fetch_asset_data_fallbacks(mock_yf, mock_info, expected):
+    """Test the defaults fetch_asset_data uses when Yahoo Finance leaves fields out"""
+    mock_yf.return_value = MockTicker(mock_info)
+    
+    result = await fetch_asset_data('AAPL')
+    
+    assert result is not None
+    for field, value in expected.items():
+        assert getattr(result, field) == value
+
+async def test_fetch_asset_data_ticker_uppercase(mock_yf):
+    """Test that ticker is converted to uppercase"""
+    mock_yf.return_value = MockTicker(APPLE_INFO)
+    
+    # Test with lowercase ticker
+    result = await fetch_asset_data('aapl')
+    
+    assert result is not None
+    assert result.ticker == 'AAPL'  # Should be uppercase
+
+async def test_fetch_asset_data_exception_handling(mock_yf):
+    """Test exception handling when Yahoo Finance API fails"""
+    # Simulate an exception when creating Ticker
+    mock_yf.side_effect = Exception("API Error")
+    
+    # Test fetch_asset_data with exception
+    result = await fetch_asset_data('INVALIDTICKER')
+    
+    assert result is None
+
+async def test_fetch_asset_data_brazilian_ticker(mock_yf):
+    """Test fetching data for Brazilian tickers"""
+    mock_info = {
+        'longName': 'Petróleo Brasileiro S.A. - Petrobras',
+        'exchange': 'B3',
+        'currency': 'BRL',
+        'currentPrice': 35.50
+    }
+    
+    mock_yf.return_value = MockTicker(mock_info)
+    
+    # Test with Brazilian ticker
+    result = await fetch_asset_data('PETR4.SA')
+    
+    assert result is not None
+    assert result.ticker == 'PETR4.SA'
+    assert result.name == 'Petróleo Brasileiro S.A. - Petrobras'
+    assert result.exchange == 'B3'
+    assert result.currency == 'BRL'
+    assert result.current_price == Decimal('35.50')
+
+async def test_search_assets_single_match():
+    """Test searching assets with exact match"""
+    with patch('app.services.yahoo_finance.fetch_asset_data') as mock_fetch:
+        mock_fetch.return_value = YahooFinanceResponse(
+            ticker='MSFT',
+            name='Microsoft Corporation',
+            exchange='NASDAQ',
+            currency='USD',
+            current_price=Decimal('330.25')
+        )
+        
+        # Test search_assets
+        results = await search_assets('MSFT')
+        
+        assert len(results) == 1
+        assert results[0].ticker == 'MSFT'
+        assert results[0].name == 'Microsoft Corporation'
+
+async def test_search_assets_no_match():
+    """Test searching assets with no matches"""
+    with patch('app.services.yahoo_finance.fetch_asset_data') as mock_fetch:
+        mock_fetch.return_value = None  # No data found
+        
+        # Test search_assets
+        results = await search_assets('NONEXISTENT')
+        
+        assert len(results) == 0
+        assert results == []
+
+async def test_search_assets_lowercase_ticker():
+    """Test searching assets with lowercase ticker"""
+    with patch('app.services.yahoo_finance.fetch_asset_data') as mock_fetch:
+        mock_fetch.return_value = YahooFinanceResponse(
+            ticker='GOOGL',
+            name='Alphabet Inc.',
+            exchange='NASDAQ',
+            currency='USD',
+            current_price=Decimal('2800.50')
+        )
+        
+        # Test with lowercase ticker
+        results = await search_assets('googl')
+        
+        assert len(results) == 1
+        assert results[0].ticker == 'GOOGL'
+
+async def test_search_assets_special_characters():
+    """Test searching assets with special characters in ticker"""
+    with patch('app.services.yahoo_finance.fetch_asset_data') as mock_fetch:
+        mock_fetch.return_value = YahooFinanceResponse(
+            ticker='VALE3.SA',
+            name='Vale S.A.',
+            exchange='B3',
+            currency='BRL',
+            current_price=Decimal('68.90')
+        )
+        
+        # Test with ticker containing special characters
+        results = await search_assets('VALE3.SA')
+        
+        assert len(results) == 1
+        assert results[0].ticker == 'VALE3.SA'
+
+async def test_fetch_asset_data_complete_mock_scenario(mock_yf):
+    """Test a complete realistic scenario with all data available"""
+    mock_info = {
+        'longName': 'Tesla, Inc.',
+        'shortName': 'Tesla',
+        'exchange': 'NASDAQ',
+        'currency': 'USD',
+        'currentPrice': 245.80,
+        'regularMarketPrice': 245.75,
+        'previousClose': 240.50,
+        'marketCap': 780000000000,
+        'volume': 25000000
+    }
+    
+    mock_yf.return_value = MockTicker(mock_info)
+    
+    # Test fetch_asset_data
+    result = await fetch_asset_data('TSLA')
+    
+    assert result is not None
+    assert result.ticker == 'TSLA'
+    assert result.name == 'Tesla, Inc.'  # Uses longName
+    assert result.exchange == 'NASDAQ'
+    assert result.currency == 'USD'
+    assert result.current_price == Decimal('245.80')  # Uses currentPrice
+
+async def test_fetch_asset_data_uses_cache(mock_yf):
+    """Test that repeated lookups for a ticker reuse the cached response"""
+    mock_yf.return_value = MockTicker(APPLE_INFO)
+    
+    first = await fetch_asset_data('AAPL')
+    second = await fetch_asset_data('aapl')
+    
+    assert mock_yf.call_count == 1
+    assert second == first
+
+async def test_fetch_asset_data_coalesces_concurrent_requests():
+    """Test that concurrent lookups for the same ticker hit Yahoo Finance once"""
+    calls = 0
+    
+    async def slow_fetch(ticker):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return YahooFinanceResponse(ticker=ticker.upper(), name='Apple Inc.', exchange='NASDAQ', currency='USD')
+    
+    with patch('app.services.yahoo_finance._fetch_asset_data', side_effect=slow_fetch):
+        results = await asyncio.gather(*(fetch_asset_data('AAPL') for _ in range(5)))
+    
+    assert calls == 1
+    assert all(result.ticker == 'AAPL' for result in results)
+
+async def test_fetch_asset_data_failure_not_cached(mock_yf):
+    """Test that failed lookups are retried instead of cached"""
+    mock_yf.side_effect = Exception("API Error")
+    assert await fetch_asset_data('AAPL') is None
+    assert await fetch_asset_data('AAPL') is None
+    
+    assert mock_yf.call_count == 2
+
+async def test_fetch_asset_data_runs_off_event_loop(mock_yf):
+    """Test that the blocking yfinance call does not run on the event loop thread"""
+    loop_thread = threading.get_ident()
+    call_threads = []
+    
+    def fake_ticker(ticker):
+        call_threads.append(threading.get_ident())
+        return MockTicker({'longName': 'Apple Inc.'})
+    
+    mock_yf.side_effect = fake_ticker
+    result = await fetch_asset_data('AAPL')
+    
+    assert result.name == 'Apple Inc.'
+    assert call_threads and call_threads[0] != loop_thread
+
+async def test_fetch_assets_bulk_skips_cached_tickers(mock_yf):
+    """Test that a bulk fetch only requests tickers missing from the cache"""
+    yahoo_finance._cache['AAPL'] = YahooFinanceResponse(ticker='AAPL', name='Apple Inc.', exchange='NASDAQ', currency='USD')
+    infos = {
+        'MSFT': {'longName': 'Microsoft Corporation', 'currentPrice': 330.25},
+        'GOOGL': {'longName': 'Alphabet Inc.'},
+    }
+    mock_yf.side_effect = lambda symbol: MockTicker(infos[symbol])
+    
+    results = await fetch_assets_bulk(['aapl', 'msft', 'googl', 'MSFT'])
+    
+    assert sorted(call.args[0] for call in mock_yf.call_args_list) == ['GOOGL', 'MSFT']
+    assert set(results) == {'AAPL', 'MSFT', 'GOOGL'}
+    assert results['AAPL'].name == 'Apple Inc.'
+    assert results['MSFT'].current_price == Decimal('330.25')
+    assert 'GOOGL' in yahoo_finance._cache
+
+async def test_fetch_assets_bulk_skips_malformed_info(mock_yf):
+    """Test that one ticker with unusable info is logged and skipped, not fatal to the batch"""
+    infos = {
+        'MSFT': {'longName': 'Microsoft Corporation'},
+        'BAD': {'longName': 'Broken Corp', 'exchange': None},
+    }
+    mock_yf.side_effect = lambda symbol: MockTicker(infos[symbol])
+    
+    results = await fetch_assets_bulk(['MSFT', 'BAD'])
+    
+    assert set(results) == {'MSFT'}
+    assert 'BAD' not in yahoo_finance._cache